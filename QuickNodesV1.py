@@ -15,12 +15,26 @@ bl_info = {
     "category": "Node",
 }
 
+import csv
+import functools
+import heapq
+import json
+import os
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from types import GeneratorType
+
 import bpy
-from bpy.types import Panel, Operator, PropertyGroup
-from bpy.props import StringProperty
+from bpy.app.handlers import persistent
+from bpy.types import Panel, Operator, PropertyGroup, AddonPreferences
+from bpy.props import StringProperty, BoolProperty, IntProperty, EnumProperty, CollectionProperty
 
-# Node definitions organized by categories
-NODE_CATEGORIES = {
+# Node definitions organized by categories. This hand-written layer decides
+# placement and labels, and is laid over the catalog generated from the
+# running Blender (see GENERATED CATALOG below)
+NODE_CATEGORY_OVERRIDES = {
     "INPUT": {
         "Constant": [
             ("ShaderNodeValue", "Value"),
@@ -124,9 +138,8 @@ NODE_CATEGORIES = {
             ("GeometryNodeBake", "Bake"),
         ],
         "Selection": [
-            ("GeometryNodeToolSelection", "Box Selection"),
+            ("GeometryNodeToolSelection", "Selection"),
             ("GeometryNodeNormalSelection", "Normal Selection"),
-            ("GeometryNodeToolSelection", "Sphere Selection"),
         ],
     },
     "CURVE": {
@@ -292,7 +305,7 @@ NODE_CATEGORIES = {
         "Sample": [
             ("GeometryNodeSampleGrid", "Sample Grid"),
             ("GeometryNodeSampleGridIndex", "Sample Grid Index"),
-            ("GeometryNodeGridCurl", "Advect Grid"),
+            ("GeometryNodeGridAdvect", "Advect Grid"),
             ("GeometryNodeGridCurl", "Grid Curl"),
             ("GeometryNodeGridDivergence", "Grid Divergence"),
             ("GeometryNodeGridGradient", "Grid Gradient"),
@@ -510,225 +523,2612 @@ NODE_CATEGORIES = {
     ],
 }
 
+# Shader editor catalog
+SHADER_NODE_CATEGORY_OVERRIDES = {
+    "INPUT": [
+        ("ShaderNodeAmbientOcclusion", "Ambient Occlusion"),
+        ("ShaderNodeAttribute", "Attribute"),
+        ("ShaderNodeBevel", "Bevel"),
+        ("ShaderNodeCameraData", "Camera Data"),
+        ("ShaderNodeVertexColor", "Color Attribute"),
+        ("ShaderNodeHairInfo", "Curves Info"),
+        ("ShaderNodeFresnel", "Fresnel"),
+        ("ShaderNodeNewGeometry", "Geometry"),
+        ("ShaderNodeLayerWeight", "Layer Weight"),
+        ("ShaderNodeLightPath", "Light Path"),
+        ("ShaderNodeObjectInfo", "Object Info"),
+        ("ShaderNodeParticleInfo", "Particle Info"),
+        ("ShaderNodePointInfo", "Point Info"),
+        ("ShaderNodeRGB", "RGB"),
+        ("ShaderNodeTangent", "Tangent"),
+        ("ShaderNodeTexCoord", "Texture Coordinate"),
+        ("ShaderNodeUVMap", "UV Map"),
+        ("ShaderNodeValue", "Value"),
+        ("ShaderNodeVolumeInfo", "Volume Info"),
+        ("ShaderNodeWireframe", "Wireframe"),
+    ],
+    "OUTPUT": [
+        ("ShaderNodeOutputMaterial", "Material Output"),
+        ("ShaderNodeOutputAOV", "AOV Output"),
+        ("ShaderNodeOutputLight", "Light Output"),
+        ("ShaderNodeOutputWorld", "World Output"),
+    ],
+    "SHADER": [
+        ("ShaderNodeBsdfPrincipled", "Principled BSDF"),
+        ("ShaderNodeMixShader", "Mix Shader"),
+        ("ShaderNodeAddShader", "Add Shader"),
+        ("ShaderNodeBsdfDiffuse", "Diffuse BSDF"),
+        ("ShaderNodeEmission", "Emission"),
+        ("ShaderNodeBsdfGlass", "Glass BSDF"),
+        ("ShaderNodeBsdfGlossy", "Glossy BSDF"),
+        ("ShaderNodeBsdfMetallic", "Metallic BSDF"),
+        ("ShaderNodeBsdfRefraction", "Refraction BSDF"),
+        ("ShaderNodeBsdfSheen", "Sheen BSDF"),
+        ("ShaderNodeSubsurfaceScattering", "Subsurface Scattering"),
+        ("ShaderNodeBsdfTranslucent", "Translucent BSDF"),
+        ("ShaderNodeBsdfTransparent", "Transparent BSDF"),
+        ("ShaderNodeBsdfToon", "Toon BSDF"),
+        ("ShaderNodeBsdfHair", "Hair BSDF"),
+        ("ShaderNodeBsdfHairPrincipled", "Principled Hair BSDF"),
+        ("ShaderNodeBsdfRayPortal", "Ray Portal BSDF"),
+        ("ShaderNodeEeveeSpecular", "Specular BSDF"),
+        ("ShaderNodeHoldout", "Holdout"),
+        ("ShaderNodeBackground", "Background"),
+        ("ShaderNodeVolumePrincipled", "Principled Volume"),
+        ("ShaderNodeVolumeAbsorption", "Volume Absorption"),
+        ("ShaderNodeVolumeScatter", "Volume Scatter"),
+    ],
+    "TEXTURE": [
+        ("ShaderNodeTexImage", "Image Texture"),
+        ("ShaderNodeTexNoise", "Noise Texture"),
+        ("ShaderNodeTexVoronoi", "Voronoi Texture"),
+        ("ShaderNodeTexGabor", "Gabor Texture"),
+        ("ShaderNodeTexMagic", "Magic Texture"),
+        ("ShaderNodeTexWave", "Wave Texture"),
+        ("ShaderNodeTexBrick", "Brick Texture"),
+        ("ShaderNodeTexChecker", "Checker Texture"),
+        ("ShaderNodeTexGradient", "Gradient Texture"),
+        ("ShaderNodeTexWhiteNoise", "White Noise Texture"),
+        ("ShaderNodeTexEnvironment", "Environment Texture"),
+        ("ShaderNodeTexSky", "Sky Texture"),
+        ("ShaderNodeTexIES", "IES Texture"),
+    ],
+    "COLOR": [
+        ("ShaderNodeValToRGB", "Color Ramp"),
+        ("ShaderNodeRGBCurve", "RGB Curves"),
+        ("ShaderNodeMix", "Mix Color"),
+        ("ShaderNodeBrightContrast", "Brightness/Contrast"),
+        ("ShaderNodeGamma", "Gamma"),
+        ("ShaderNodeHueSaturation", "Hue/Saturation/Value"),
+        ("ShaderNodeInvert", "Invert Color"),
+        ("ShaderNodeLightFalloff", "Light Falloff"),
+    ],
+    "VECTOR": [
+        ("ShaderNodeMapping", "Mapping"),
+        ("ShaderNodeBump", "Bump"),
+        ("ShaderNodeNormalMap", "Normal Map"),
+        ("ShaderNodeNormal", "Normal"),
+        ("ShaderNodeDisplacement", "Displacement"),
+        ("ShaderNodeVectorDisplacement", "Vector Displacement"),
+        ("ShaderNodeVectorMath", "Vector Math"),
+        ("ShaderNodeVectorCurve", "Vector Curves"),
+        ("ShaderNodeVectorRotate", "Vector Rotate"),
+        ("ShaderNodeVectorTransform", "Vector Transform"),
+        ("ShaderNodeCombineXYZ", "Combine XYZ"),
+        ("ShaderNodeSeparateXYZ", "Separate XYZ"),
+    ],
+    "CONVERTER": [
+        ("ShaderNodeMath", "Math"),
+        ("ShaderNodeMapRange", "Map Range"),
+        ("ShaderNodeClamp", "Clamp"),
+        ("ShaderNodeFloatCurve", "Float Curve"),
+        ("ShaderNodeBlackbody", "Blackbody"),
+        ("ShaderNodeWavelength", "Wavelength"),
+        ("ShaderNodeCombineColor", "Combine Color"),
+        ("ShaderNodeSeparateColor", "Separate Color"),
+        ("ShaderNodeRGBToBW", "RGB to BW"),
+        ("ShaderNodeShaderToRGB", "Shader to RGB"),
+    ],
+    "GROUP": [
+        ("NodeGroupInput", "Group Input"),
+        ("NodeGroupOutput", "Group Output"),
+    ],
+    "LAYOUT": [
+        ("NodeFrame", "Frame"),
+        ("NodeReroute", "Reroute"),
+    ],
+}
+
+# Compositor catalog
+COMPOSITOR_NODE_CATEGORY_OVERRIDES = {
+    "INPUT": [
+        ("CompositorNodeRLayers", "Render Layers"),
+        ("CompositorNodeImage", "Image"),
+        ("CompositorNodeMovieClip", "Movie Clip"),
+        ("CompositorNodeMask", "Mask"),
+        ("CompositorNodeRGB", "RGB"),
+        ("CompositorNodeValue", "Value"),
+        ("CompositorNodeBokehImage", "Bokeh Image"),
+        ("CompositorNodeTime", "Time Curve"),
+    ],
+    "OUTPUT": [
+        ("NodeGroupOutput", "Group Output"),
+        ("CompositorNodeViewer", "Viewer"),
+        ("CompositorNodeOutputFile", "File Output"),
+    ],
+    "COLOR": [
+        ("CompositorNodeAlphaOver", "Alpha Over"),
+        ("CompositorNodeBrightContrast", "Brightness/Contrast"),
+        ("CompositorNodeColorBalance", "Color Balance"),
+        ("CompositorNodeColorCorrection", "Color Correction"),
+        ("CompositorNodeExposure", "Exposure"),
+        ("CompositorNodeGamma", "Gamma"),
+        ("CompositorNodeHueCorrect", "Hue Correct"),
+        ("CompositorNodeHueSat", "Hue/Saturation/Value"),
+        ("CompositorNodeInvert", "Invert Color"),
+        ("CompositorNodeCurveRGB", "RGB Curves"),
+        ("CompositorNodeTonemap", "Tonemap"),
+        ("CompositorNodeValToRGB", "Color Ramp"),
+    ],
+    "FILTER": [
+        ("CompositorNodeBlur", "Blur"),
+        ("CompositorNodeBilateralblur", "Bilateral Blur"),
+        ("CompositorNodeBokehBlur", "Bokeh Blur"),
+        ("CompositorNodeDefocus", "Defocus"),
+        ("CompositorNodeDenoise", "Denoise"),
+        ("CompositorNodeDilateErode", "Dilate/Erode"),
+        ("CompositorNodeFilter", "Filter"),
+        ("CompositorNodeGlare", "Glare"),
+        ("CompositorNodeKuwahara", "Kuwahara"),
+        ("CompositorNodePixelate", "Pixelate"),
+        ("CompositorNodeVecBlur", "Vector Blur"),
+    ],
+    "KEYING": [
+        ("CompositorNodeKeying", "Keying"),
+        ("CompositorNodeChromaMatte", "Chroma Key"),
+        ("CompositorNodeColorMatte", "Color Key"),
+        ("CompositorNodeDiffMatte", "Difference Key"),
+        ("CompositorNodeDistanceMatte", "Distance Key"),
+        ("CompositorNodeLumaMatte", "Luminance Key"),
+        ("CompositorNodeColorSpill", "Color Spill"),
+    ],
+    "TRANSFORM": [
+        ("CompositorNodeTransform", "Transform"),
+        ("CompositorNodeTranslate", "Translate"),
+        ("CompositorNodeRotate", "Rotate"),
+        ("CompositorNodeScale", "Scale"),
+        ("CompositorNodeFlip", "Flip"),
+        ("CompositorNodeCrop", "Crop"),
+        ("CompositorNodeLensdist", "Lens Distortion"),
+    ],
+    "UTILITIES": [
+        ("ShaderNodeMath", "Math"),
+        ("ShaderNodeMapRange", "Map Range"),
+        ("ShaderNodeClamp", "Clamp"),
+        ("ShaderNodeMix", "Mix"),
+        ("CompositorNodeSwitch", "Switch"),
+        ("CompositorNodeNormalize", "Normalize"),
+        ("CompositorNodeLevels", "Levels"),
+    ],
+    "GROUP": [
+        ("NodeGroupInput", "Group Input"),
+        ("NodeGroupOutput", "Group Output"),
+    ],
+    "LAYOUT": [
+        ("NodeFrame", "Frame"),
+        ("NodeReroute", "Reroute"),
+    ],
+}
+
+# Legacy texture node catalog
+TEXTURE_NODE_CATEGORY_OVERRIDES = {
+    "INPUT": [
+        ("TextureNodeCoordinates", "Coordinates"),
+        ("TextureNodeCurveTime", "Curve Time"),
+        ("TextureNodeImage", "Image"),
+        ("TextureNodeTexture", "Texture"),
+    ],
+    "OUTPUT": [
+        ("TextureNodeOutput", "Output"),
+        ("TextureNodeViewer", "Viewer"),
+    ],
+    "TEXTURE": [
+        ("TextureNodeBricks", "Bricks"),
+        ("TextureNodeChecker", "Checker"),
+        ("TextureNodeTexBlend", "Blend"),
+        ("TextureNodeTexClouds", "Clouds"),
+        ("TextureNodeTexDistNoise", "Distorted Noise"),
+        ("TextureNodeTexMagic", "Magic"),
+        ("TextureNodeTexMarble", "Marble"),
+        ("TextureNodeTexMusgrave", "Musgrave"),
+        ("TextureNodeTexNoise", "Noise"),
+        ("TextureNodeTexStucci", "Stucci"),
+        ("TextureNodeTexVoronoi", "Voronoi"),
+        ("TextureNodeTexWood", "Wood"),
+    ],
+    "COLOR": [
+        ("TextureNodeMixRGB", "Mix RGB"),
+        ("TextureNodeCurveRGB", "RGB Curves"),
+        ("TextureNodeInvert", "Invert Color"),
+        ("TextureNodeHueSaturation", "Hue/Saturation/Value"),
+        ("TextureNodeCombineColor", "Combine Color"),
+        ("TextureNodeSeparateColor", "Separate Color"),
+    ],
+    "CONVERTER": [
+        ("TextureNodeMath", "Math"),
+        ("TextureNodeValToRGB", "Color Ramp"),
+        ("TextureNodeRGBToBW", "RGB to BW"),
+        ("TextureNodeValToNor", "Value to Normal"),
+        ("TextureNodeDistance", "Distance"),
+    ],
+    "DISTORT": [
+        ("TextureNodeAt", "At"),
+        ("TextureNodeRotate", "Rotate"),
+        ("TextureNodeScale", "Scale"),
+        ("TextureNodeTranslate", "Translate"),
+    ],
+    "LAYOUT": [
+        ("NodeFrame", "Frame"),
+        ("NodeReroute", "Reroute"),
+    ],
+}
+
+# Hand-written catalog of every supported tree type
+TREE_CATALOG_OVERRIDES = {
+    "GeometryNodeTree": NODE_CATEGORY_OVERRIDES,
+    "ShaderNodeTree": SHADER_NODE_CATEGORY_OVERRIDES,
+    "CompositorNodeTree": COMPOSITOR_NODE_CATEGORY_OVERRIDES,
+    "TextureNodeTree": TEXTURE_NODE_CATEGORY_OVERRIDES,
+}
+
+# Search keywords and aliases by bl_idname, for users searching by intent
+# rather than by Blender's label. Shared by every tree type using the node
+NODE_KEYWORDS = {
+    # Flow control
+    "GeometryNodeSwitch": ("if", "else", "condition", "branch", "toggle"),
+    "GeometryNodeIndexSwitch": ("if", "select", "case", "choose"),
+    "GeometryNodeMenuSwitch": ("if", "case", "enum", "dropdown", "choose"),
+    "CompositorNodeSwitch": ("if", "toggle", "condition"),
+    "QUICKNODES_OT_add_repeat_zone": ("loop", "iterate", "for", "while"),
+    "QUICKNODES_OT_add_foreach_element_zone": ("loop", "iterate", "for", "each"),
+    "QUICKNODES_OT_add_simulation_zone": ("physics", "frame", "cache", "state"),
+    "QUICKNODES_OT_add_closure_zone": ("function", "lambda", "callback"),
+    # Math
+    "ShaderNodeMix": ("lerp", "blend", "interpolate", "mixrgb"),
+    "TextureNodeMixRGB": ("lerp", "blend", "interpolate"),
+    "ShaderNodeMixShader": ("lerp", "blend"),
+    "ShaderNodeMapRange": ("remap", "fit", "normalize", "rescale", "smoothstep"),
+    "ShaderNodeClamp": ("limit", "saturate", "minmax"),
+    "ShaderNodeMath": ("add", "multiply", "divide", "power", "sin", "abs", "modulo", "float"),
+    "ShaderNodeVectorMath": ("dot", "cross", "length", "normalize", "distance", "add"),
+    "FunctionNodeIntegerMath": ("add", "multiply", "modulo", "gcd", "int"),
+    "FunctionNodeBooleanMath": ("and", "or", "not", "xor", "logic"),
+    "FunctionNodeCompare": ("equal", "greater", "less", "threshold", "test"),
+    "ShaderNodeFloatCurve": ("falloff", "ramp", "profile", "remap"),
+    "ShaderNodeValToRGB": ("gradient", "ramp", "colorramp"),
+    "FunctionNodeRandomValue": ("noise", "jitter", "rand", "seed"),
+    "FunctionNodeHashValue": ("random", "seed"),
+    # Geometry
+    "GeometryNodeDistributePointsOnFaces": ("scatter", "spread", "sprinkle", "poisson"),
+    "GeometryNodeDistributePointsInVolume": ("fill", "random"),
+    "GeometryNodeDistributePointsInGrid": ("fill", "lattice"),
+    "GeometryNodeInstanceOnPoints": ("copy", "clone", "array", "place"),
+    "GeometryNodeRealizeInstances": ("apply", "bake", "make", "real"),
+    "GeometryNodeJoinGeometry": ("merge", "combine", "append", "union"),
+    "GeometryNodeMergeByDistance": ("weld", "remove", "doubles"),
+    "GeometryNodeDeleteGeometry": ("remove", "erase", "mask", "cull"),
+    "GeometryNodeSeparateGeometry": ("split", "mask", "filter"),
+    "GeometryNodeTransform": ("move", "rotate", "scale", "translate", "offset"),
+    "GeometryNodeSetPosition": ("move", "offset", "displace", "deform"),
+    "GeometryNodeMeshBoolean": ("union", "difference", "intersect", "csg", "subtract"),
+    "GeometryNodeSubdivisionSurface": ("smooth", "subsurf", "catmull"),
+    "GeometryNodeExtrudeMesh": ("extend", "inset", "push"),
+    "GeometryNodeRaycast": ("trace", "hit", "project", "intersect"),
+    "GeometryNodeProximity": ("distance", "closest", "nearest"),
+    "GeometryNodeSampleNearest": ("closest", "nearest", "lookup"),
+    "GeometryNodeSampleIndex": ("lookup", "fetch", "read"),
+    "GeometryNodeCaptureAttribute": ("store", "freeze", "remember"),
+    "GeometryNodeStoreNamedAttribute": ("write", "save", "output"),
+    "GeometryNodeInputNamedAttribute": ("read", "get", "attribute"),
+    "GeometryNodeViewer": ("debug", "inspect", "preview", "spreadsheet"),
+    "GeometryNodeBoundBox": ("bounds", "aabb", "extents", "size"),
+    "GeometryNodeConvexHull": ("hull", "wrap"),
+    "GeometryNodeCurveToMesh": ("sweep", "loft", "pipe", "tube", "bevel"),
+    "GeometryNodeMeshToPoints": ("vertices", "verts"),
+    "GeometryNodeAccumulateField": ("sum", "running", "total", "prefix"),
+    "GeometryNodeAttributeStatistic": ("average", "mean", "min", "max", "sum"),
+    "GeometryNodeSortElements": ("order", "reorder"),
+    "GeometryNodeDuplicateElements": ("copy", "clone", "repeat"),
+    "FunctionNodeFormatString": ("printf", "format", "text"),
+    "GeometryNodeStringJoin": ("concat", "concatenate", "text"),
+    "NodeFrame": ("comment", "group", "box", "note"),
+    "NodeReroute": ("dot", "redirect", "wire"),
+    # Shading
+    "ShaderNodeTexNoise": ("perlin", "fbm", "fractal", "random"),
+    "ShaderNodeTexVoronoi": ("cells", "worley", "cellular"),
+    "ShaderNodeTexWhiteNoise": ("random", "hash"),
+    "ShaderNodeBsdfPrincipled": ("pbr", "material", "surface", "standard"),
+    "ShaderNodeEmission": ("glow", "light", "emit"),
+    "ShaderNodeBump": ("height", "normal", "relief"),
+    "ShaderNodeNormalMap": ("tangent", "bump"),
+    "ShaderNodeTexImage": ("picture", "bitmap", "photo", "texture"),
+    "ShaderNodeTexCoord": ("uv", "coordinates", "generated", "object"),
+    "ShaderNodeSeparateXYZ": ("split", "components", "xyz"),
+    "ShaderNodeCombineXYZ": ("compose", "vector", "xyz"),
+    "CompositorNodeAlphaOver": ("composite", "over", "layer"),
+    "CompositorNodeBlur": ("gaussian", "soften", "smooth"),
+    "CompositorNodeGlare": ("bloom", "streaks", "flare"),
+}
+
 # Flatten all nodes for search functionality
-ALL_NODES = []
-for category, content in NODE_CATEGORIES.items():
-    if isinstance(content, dict):
-        for subcategory, nodes in content.items():
-            for node in nodes:
-                ALL_NODES.append(node)
-    else:
-        for node in content:
-            ALL_NODES.append(node)
+def flatten_catalog(categories):
+    nodes = []
+    for category, content in categories.items():
+        if isinstance(content, dict):
+            for subcategory, sub_nodes in content.items():
+                nodes.extend(sub_nodes)
+        else:
+            nodes.extend(content)
+    return nodes
 
-# Properties for search functionality
-class QuickNodesProperties(PropertyGroup):
-    search_filter: StringProperty(
-        name="Search Filter",
-        description="Filter nodes by name",
-        default=""
-    )
+# One placement of a node type in the catalog of a tree type
+class CatalogEntry:
+    """Catalog entry with a stable id, see catalog_entry_id()"""
+    __slots__ = ("id", "node_type", "label", "path")
+    
+    def __init__(self, entry_id, node_type, label, path):
+        self.id = entry_id
+        self.node_type = node_type
+        self.label = label
+        # (category,) or (category, subcategory)
+        self.path = path
+    
+    @property
+    def node(self):
+        return self.node_type, self.label
+    
+    def __repr__(self):
+        return f"CatalogEntry({self.id}, {self.node_type!r}, {self.label!r}, {self.path!r})"
 
-# Function to deselect all nodes
-def deselect_all_nodes(context):
-    """Deselect all nodes in the current node tree"""
-    space = context.space_data
-    if space.type == 'NODE_EDITOR' and space.edit_tree:
-        for node in space.edit_tree.nodes:
-            node.select = False
+def catalog_entry_id(tree_type, path, node_type, label, occurrence=0, salt=0):
+    """Return the id of an entry, the same across rebuilds and sessions.
 
-# Operator to add a node to the active node tree
-class QUICKNODES_OT_add_node(Operator):
-    bl_idname = "quicknodes.add_node"
-    bl_label = "Add Node"
-    bl_description = "Add a node to the active node tree"
+    occurrence tells apart entries repeated under the same path and label,
+    salt moves an entry off the id of another one it collides with.
+    """
+    key = "\x1f".join((tree_type,) + path + (node_type, label, str(occurrence)))
+    if salt:
+        key += f"\x1f{salt}"
+    return zlib.crc32(key.encode("utf-8"))
+
+# Every entry of categories in catalog order
+def catalog_entries(tree_type, categories):
+    entries = []
+    occurrences = {}
+    used_ids = set()
     
-    node_type: StringProperty()
+    def add(node_type, label, path):
+        key = (path, node_type, label)
+        occurrence = occurrences[key] = occurrences.get(key, -1) + 1
+        entry_id = catalog_entry_id(tree_type, path, node_type, label, occurrence)
+        salt = 0
+        while entry_id in used_ids:
+            # A CRC32 collision, the later entry in catalog order gets a salted id
+            salt += 1
+            entry_id = catalog_entry_id(tree_type, path, node_type, label, occurrence, salt)
+        if salt:
+            print(f"Quick Nodes: id of {node_type} in {' > '.join(path)} collides with another entry, using a salted id")
+        used_ids.add(entry_id)
+        entries.append(CatalogEntry(entry_id, node_type, label, path))
     
-    def execute(self, context):
-        space = context.space_data
-        if space.type == 'NODE_EDITOR' and space.edit_tree:
-            node_tree = space.edit_tree
-            
-            # Deselect all existing nodes
-            deselect_all_nodes(context)
-            
-            # Create the node
-            node = node_tree.nodes.new(type=self.node_type)
-            
-            # Place node 800 units to the left of cursor location
-            cursor_loc = context.space_data.cursor_location
-            node.location = (cursor_loc[0] - 800, cursor_loc[1])
-            
-            # Select the newly created node
-            node.select = True
-            node_tree.nodes.active = node
-            
-            return {'FINISHED'}
+    for category, content in categories.items():
+        if isinstance(content, dict):
+            for subcategory, sub_nodes in content.items():
+                for node_type, label in sub_nodes:
+                    add(node_type, label, (category, subcategory))
         else:
-            self.report({'ERROR'}, "No active node tree found")
-            return {'CANCELLED'}
+            for node_type, label in content:
+                add(node_type, label, (category,))
+    return entries
 
-# DEFINE FUNCTIONS FOR NODE PAIRS
-# ============================================================================
+# Search index built once from the catalog
+class NodeSearchIndex:
+    """Ranked, typo tolerant search over node names, keywords and category paths.
 
-class QUICKNODES_OT_add_simulation_zone(Operator):
-    bl_idname = "quicknodes.add_simulation_zone"
-    bl_label = "Simulation Zone"
-    bl_options = {'REGISTER', 'UNDO'}
-    
-    def execute(self, context):
-        space = context.space_data
-        if space.type == 'NODE_EDITOR' and space.edit_tree:
-            tree = space.edit_tree
-            cursor_loc = space.cursor_location
-            
-            # Deselect all existing nodes
-            deselect_all_nodes(context)
-            
-            # Create the simulation zone nodes
-            node_input = tree.nodes.new("GeometryNodeSimulationInput")
-            node_output = tree.nodes.new("GeometryNodeSimulationOutput")
-            
-            # Position the nodes horizontally (input on left, output on right)
-            node_input.location = (cursor_loc[0] - 900, cursor_loc[1])
-            node_output.location = (cursor_loc[0] - 700, cursor_loc[1])
-            
-            # Pair the nodes
-            node_input.pair_with_output(node_output)
-            
-            # Select both nodes in the pair for easy movement
-            node_input.select = True
-            node_output.select = True
-            tree.nodes.active = node_input
-            
-            return {'FINISHED'}
+    Names are lowercased once and every 1, 2 and 3 character gram of the name
+    (with and without spaces) maps to the ids of the nodes containing it. A
+    query is only scored against the nodes sharing at least one of its grams
+    or word initials, and the best results are kept with a bounded heap.
+
+    Name words, NODE_KEYWORDS and category path words also go into one
+    inverted index of tokens and token prefixes. A query matches the nodes in
+    the intersection of the posting lists of its words, in any order. The
+    bl_idname is only matched whole, its prefixes ("geo", "func") are shared
+    by whole node families and would outrank better matches.
+    """
+    GRAM_SIZE = 3
+    # Nodes indexed between two yields of index_steps()
+    INDEX_CHUNK = 20
+
+    # Score tiers, higher is better
+    SCORE_EXACT = 100
+    SCORE_PREFIX = 90
+    SCORE_WORD_START = 80
+    SCORE_SUBSTRING = 70
+    SCORE_COMPACT = 65
+    SCORE_INITIALS = 60
+    SCORE_SUBSEQUENCE = 50
+    SCORE_TYPO = 30
+    # Keyword scores, a word naming a keyword ranks with word starts of the name
+    SCORE_KEYWORD = 85
+    SCORE_KEYWORD_PREFIX = 55
+    SCORE_TERMS = 40
+
+    def __init__(self, nodes, keywords=None, paths=None, build=True):
+        """nodes are (node_type, label), keywords maps node types to extra words and
+        paths lists the category names of each node. Without build the nodes are
+        only indexed by running index_steps()."""
+        self.nodes = list(nodes)
+        self.names = [node[1].lower() for node in self.nodes]
+        self.compact = [name.replace(" ", "") for name in self.names]
+        self.words = [tuple(name.split()) for name in self.names]
+        self.initials = ["".join(word[0] for word in words) for words in self.words]
+        self.grams = {}
+        self.keywords = [frozenset(keyword.lower() for keyword in (keywords or {}).get(node_type, ()))
+                         for node_type, _ in self.nodes]
+        self.paths = paths
+        self.tokens = {}
+        self.prefixes = {}
+        if build:
+            for _ in self.index_steps():
+                pass
+
+    def index_steps(self):
+        """Fill the gram and token indexes, yielding after every INDEX_CHUNK nodes"""
+        for node_id in range(len(self.nodes)):
+            self.index_node(node_id)
+            if node_id % self.INDEX_CHUNK == self.INDEX_CHUNK - 1:
+                yield
+
+    def index_node(self, node_id):
+        for text in (self.names[node_id], self.compact[node_id]):
+            for size in range(1, self.GRAM_SIZE + 1):
+                for i in range(len(text) - size + 1):
+                    self.grams.setdefault(text[i:i + size], set()).add(node_id)
+        initials = self.initials[node_id]
+        for i in range(1, len(initials) + 1):
+            self.grams.setdefault("^" + initials[:i], set()).add(node_id)
+
+        # The full bl_idname is its own only prefix
+        idname = self.nodes[node_id][0].lower()
+        self.tokens.setdefault(idname, set()).add(node_id)
+        self.prefixes.setdefault(idname, set()).add(node_id)
+        path_words = [word for name in (self.paths[node_id] if self.paths else ())
+                      for word in name.lower().split()]
+        for token in self.keywords[node_id].union(self.words[node_id], path_words):
+            self.tokens.setdefault(token, set()).add(node_id)
+            for i in range(2, len(token) + 1):
+                self.prefixes.setdefault(token[:i], set()).add(node_id)
+
+    def candidates(self, term):
+        """Ids of the nodes sharing the word initials or enough grams with term"""
+        compact = term.replace(" ", "")
+        ids = set(self.grams.get("^" + compact, ()))
+        if len(compact) <= self.GRAM_SIZE:
+            ids.update(self.grams.get(compact, ()))
+            return ids
+
+        # Longer terms need two shared trigrams, which still lets one typo through
+        trigrams = {compact[i:i + self.GRAM_SIZE] for i in range(len(compact) - self.GRAM_SIZE + 1)}
+        required = 1 if len(trigrams) <= 2 else 2
+        shared = {}
+        for gram in trigrams:
+            for node_id in self.grams.get(gram, ()):
+                shared[node_id] = shared.get(node_id, 0) + 1
+        ids.update(node_id for node_id, count in shared.items() if count >= required)
+        return ids
+
+    def keyword_matches(self, term):
+        """Return {node_id: score} of the nodes with a token or token prefix for every word of term"""
+        words = term.split()
+        postings = [self.prefixes.get(word, ()) if len(word) > 1 else self.tokens.get(word, ())
+                    for word in words]
+        postings.sort(key=len)
+        if not postings[0]:
+            return {}
+        ids = set(postings[0]).intersection(*postings[1:])
+
+        matches = {}
+        for node_id in ids:
+            keywords = self.keywords[node_id]
+            if any(word in keywords for word in words) or self.nodes[node_id][0].lower() in words:
+                matches[node_id] = self.SCORE_KEYWORD
+            elif any(keyword.startswith(word) for word in words for keyword in keywords):
+                matches[node_id] = self.SCORE_KEYWORD_PREFIX
+            else:
+                matches[node_id] = self.SCORE_TERMS
+        return matches
+
+    def score(self, node_id, term):
+        """Score how well the node matches term, 0 if it does not match at all"""
+        name = self.names[node_id]
+        if name == term:
+            return self.SCORE_EXACT
+        position = name.find(term)
+        if position == 0:
+            return self.SCORE_PREFIX
+        if position > 0:
+            if name[position - 1] == " ":
+                return self.SCORE_WORD_START
+            return self.SCORE_SUBSTRING - min(position, 10) * 0.1
+
+        compact_term = term.replace(" ", "")
+        compact = self.compact[node_id]
+        if compact_term in compact:
+            return self.SCORE_COMPACT
+        if self.initials[node_id].startswith(compact_term):
+            return self.SCORE_INITIALS
+
+        match = subsequence_match(compact_term, compact)
+        if match is not None:
+            start, gaps = match
+            return self.SCORE_SUBSEQUENCE - min(gaps, 15) - min(start, 5)
+
+        # Tolerate typos once the term is long enough to be meaningful
+        if len(compact_term) >= 4:
+            max_distance = 1 if len(compact_term) < 7 else 2
+            distance = min(
+                edit_distance(compact_term, text, max_distance)
+                for text in self.words[node_id] + (compact[:len(compact_term)],)
+            )
+            if distance <= max_distance:
+                return self.SCORE_TYPO - distance * 10
+        return 0
+
+    def search(self, term, limit=None, boosts=None):
+        """Return (total, nodes) with the best limit matches for term, best first.
+
+        boosts maps node types to a bonus ranking their matches first among
+        matches of the same score, it never lifts a match above a better one.
+        """
+        term = " ".join(term.lower().split())
+        if not term:
+            return 0, []
+
+        matches = self.keyword_matches(term)
+        for node_id in self.candidates(term):
+            score = self.score(node_id, term)
+            if score > matches.get(node_id, 0):
+                matches[node_id] = score
+
+        scored = []
+        for node_id, score in matches.items():
+            boost = boosts.get(self.nodes[node_id][0], 0.0) if boosts else 0.0
+            # Ties go to the more used node, then to the shorter name, then to catalog order
+            scored.append((score, boost, -len(self.names[node_id]), -node_id))
+
+        if limit is None or limit >= len(scored):
+            best = sorted(scored, reverse=True)
         else:
-            self.report({'ERROR'}, "No active node tree found")
-            return {'CANCELLED'}
+            best = heapq.nlargest(limit, scored)
+        return len(scored), [self.nodes[-key[3]] for key in best]
 
+def subsequence_match(term, text):
+    """Return (start, gaps) of the first in-order match of term's characters in text, or None"""
+    position = -1
+    start = None
+    for char in term:
+        position = text.find(char, position + 1)
+        if position < 0:
+            return None
+        if start is None:
+            start = position
+    return start, position - start + 1 - len(term)
 
-class QUICKNODES_OT_add_foreach_element_zone(Operator):
-    bl_idname = "quicknodes.add_foreach_element_zone"
-    bl_label = "For Each Element"
-    bl_options = {'REGISTER', 'UNDO'}
+def edit_distance(a, b, max_distance):
+    """Optimal string alignment distance between a and b, capped at max_distance + 1"""
+    # Every edit changes the character sets by at most two symbols
+    if abs(len(a) - len(b)) > max_distance or len(set(a) ^ set(b)) > 2 * max_distance:
+        return max_distance + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+# The catalog of one tree type with everything derived from it
+class CatalogView:
+    """Categories, entries, lookup indexes and search index of one tree type, built once.
+
+    A node type may be listed in several places (Group Input under INPUT and
+    GROUP, Mix as Mix Color and Mix Vector). by_type and by_path map to the
+    ids of every such entry, resolved through by_id, while nodes and the
+    search index hold each (node_type, label) once. Without build_index the
+    search index is filled by running its index_steps().
+    """
+    def __init__(self, tree_type, categories, build_index=True):
+        self.tree_type = tree_type
+        self.categories = categories
+        self.entries = catalog_entries(tree_type, categories)
+        self.by_id = {entry.id: entry for entry in self.entries}
+        self.by_type = {}
+        self.by_path = {}
+        for entry in self.entries:
+            self.by_type.setdefault(entry.node_type, []).append(entry.id)
+            self.by_path.setdefault(entry.path, []).append(entry.id)
+        self.duplicates = {node_type: ids for node_type, ids in self.by_type.items() if len(ids) > 1}
+        
+        # Distinct (node_type, label) pairs with the category names of all their entries
+        paths = {}
+        for entry in self.entries:
+            paths.setdefault(entry.node, set()).update(entry.path)
+        self.nodes = list(paths)
+        self.search_index = NodeSearchIndex(self.nodes, NODE_KEYWORDS, list(paths.values()), build_index)
     
-    def execute(self, context):
-        space = context.space_data
-        if space.type == 'NODE_EDITOR' and space.edit_tree:
-            tree = space.edit_tree
-            cursor_loc = space.cursor_location
-            
-            # Deselect all existing nodes
-            deselect_all_nodes(context)
-            
-            # Create the for each element nodes
-            node_input = tree.nodes.new("GeometryNodeForeachGeometryElementInput")
-            node_output = tree.nodes.new("GeometryNodeForeachGeometryElementOutput")
-            
-            # Position the nodes horizontally (input on left, output on right)
-            node_input.location = (cursor_loc[0] - 900, cursor_loc[1])
-            node_output.location = (cursor_loc[0] - 700, cursor_loc[1])
-            
-            # Pair the nodes
-            node_input.pair_with_output(node_output)
-            
-            # Select both nodes in the pair for easy movement
-            node_input.select = True
-            node_output.select = True
-            tree.nodes.active = node_input
-            
-            return {'FINISHED'}
+    def find(self, node_type):
+        """Return the first catalog entry of node_type, or None"""
+        ids = self.by_type.get(node_type)
+        return self.by_id[ids[0]] if ids else None
+    
+    def repeated_entries(self):
+        """Return the entries listed more than once under the same path and label"""
+        seen = set()
+        repeated = []
+        for entry in self.entries:
+            key = (entry.node_type, entry.label, entry.path)
+            if key in seen:
+                repeated.append(entry)
+            seen.add(key)
+        return repeated
+
+# Tree type -> CatalogView, switching editors is a dict lookup
+CATALOG_VIEWS = {}
+# (panel bl_idname, tree type) -> whether the panel polls visible, see QuickNodesPanel
+_panel_visibility = {}
+
+def get_catalog_view(tree_type):
+    """Return the catalog view of tree_type, building it on first use"""
+    view = CATALOG_VIEWS.get(tree_type)
+    if view is None:
+        if tree_type in TREE_CATALOG_OVERRIDES:
+            # Needed before the warm-up finished it, the node types come first
+            run_warmup_task("node_types")
+            run_warmup_task("catalog " + tree_type)
+            view = CATALOG_VIEWS.get(tree_type) or build_catalog_view(tree_type)
         else:
-            self.report({'ERROR'}, "No active node tree found")
-            return {'CANCELLED'}
+            # Tree types without a catalog (custom node trees) get an empty one
+            view = CATALOG_VIEWS[tree_type] = CatalogView(tree_type, {})
+    return view
+
+# Search results, ranked once per query and tree type and shown a page at a time
+SEARCH_CACHE_SIZE = 64
+SEARCH_PAGE_SIZE = 30
+_search_cache = OrderedDict()
+
+def get_search_results(query, tree_type, page=0):
+    """Return (total, results) for page of query in tree_type.
+
+    The query is scored and ranked once, the cache keeps every match in
+    order so turning pages only slices it.
+    """
+    key = (query.lower(), tree_type)
+    end = (page + 1) * SEARCH_PAGE_SIZE
+    cached = _search_cache.get(key)
+    if cached is None:
+        boosts = USAGE_STATS.view(tree_type)[2]
+        total, nodes = get_catalog_view(tree_type).search_index.search(query, None, boosts)
+        cached = _search_cache[key] = (total, tuple(nodes))
+        if len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+    else:
+        _search_cache.move_to_end(key)
+    total, nodes = cached
+    return total, nodes[page * SEARCH_PAGE_SIZE:end]
+
+def invalidate_search_cache(tree_type=None):
+    """Drop cached search results, call whenever the catalog changes.
+
+    With tree_type only the catalog rankings of that tree type are dropped,
+    for changes such as usage boosts that don't affect the other tree types
+    or the library results.
+    """
+    if tree_type is None:
+        _search_cache.clear()
+        return
+    for key in [key for key in _search_cache if len(key) == 2 and key[1] == tree_type]:
+        del _search_cache[key]
+
+# USAGE STATISTICS
+# ============================================================================
+
+# Entries kept, the least used are dropped beyond this
+USAGE_CAPACITY = 200
+# Weight left to a past add after each new one
+USAGE_DECAY = 0.97
+# Entries shown in each list of the Recent panel
+USAGE_PANEL_SIZE = 8
+# Search bonus tends to this, it only orders matches of equal score
+USAGE_MAX_BOOST = 9.0
+# Decayed count giving half of USAGE_MAX_BOOST
+USAGE_BOOST_HALF = 4.0
+# Seconds between an add and the statistics being written to disk
+USAGE_FLUSH_DELAY = 30.0
+
+class UsageStats:
+    """Decayed add counts and last use of catalog entries, per node tree type.
+
+    Entries are (tree type, node type) -> [label, score, tick]. Scores decay
+    lazily: the tick of the last update says how many adds happened since,
+    each one scaling the score by USAGE_DECAY.
+    """
     
+    def __init__(self):
+        self.entries = {}
+        self.tick = 0
+        self.dirty = False
+        self._views = {}
     
-class QUICKNODES_OT_add_repeat_zone(Operator):
-    bl_idname = "quicknodes.add_repeat_zone"
-    bl_label = "Repeat"
-    bl_options = {'REGISTER', 'UNDO'}
+    def decayed(self, entry):
+        return entry[1] * USAGE_DECAY ** (self.tick - entry[2])
     
-    def execute(self, context):
-        space = context.space_data
-        if space.type == 'NODE_EDITOR' and space.edit_tree:
-            tree = space.edit_tree
-            cursor_loc = space.cursor_location
-            
-            # Deselect all existing nodes
-            deselect_all_nodes(context)
-            
-            # Create the repeat zone nodes
-            node_input = tree.nodes.new("GeometryNodeRepeatInput")
-            node_output = tree.nodes.new("GeometryNodeRepeatOutput")
-            
-            # Position the nodes horizontally (input on left, output on right)
-            node_input.location = (cursor_loc[0] - 900, cursor_loc[1])
-            node_output.location = (cursor_loc[0] - 700, cursor_loc[1])
-            
-            # Pair the nodes
-            node_input.pair_with_output(node_output)
-            
-            # Select both nodes in the pair for easy movement
-            node_input.select = True
-            node_output.select = True
-            tree.nodes.active = node_input
-            
-            return {'FINISHED'}
-        else:
-            self.report({'ERROR'}, "No active node tree found")
-            return {'CANCELLED'}
-            
-class QUICKNODES_OT_add_closure_zone(Operator):
-    bl_idname = "quicknodes.add_closure_zone"
-    bl_label = "Repeat"
-    bl_options = {'REGISTER', 'UNDO'}
+    def record(self, tree_type, node_type, label):
+        self.tick += 1
+        key = (tree_type, node_type)
+        entry = self.entries.get(key)
+        score = self.decayed(entry) if entry else 0.0
+        self.entries[key] = [label, score + 1.0, self.tick]
+        if len(self.entries) > USAGE_CAPACITY:
+            del self.entries[min(self.entries, key=lambda key: self.decayed(self.entries[key]))]
+        self.dirty = True
+        self._views.clear()
     
-    def execute(self, context):
-        space = context.space_data
-        if space.type == 'NODE_EDITOR' and space.edit_tree:
-            tree = space.edit_tree
-            cursor_loc = space.cursor_location
-            
-            # Deselect all existing nodes
-            deselect_all_nodes(context)
-            
-            # Create the closure zone nodes
-            node_input = tree.nodes.new("NodeClosureInput")
-            node_output = tree.nodes.new("NodeClosureOutput")
-            
-            # Position the nodes horizontally (input on left, output on right)
-            node_input.location = (cursor_loc[0] - 900, cursor_loc[1])
-            node_output.location = (cursor_loc[0] - 700, cursor_loc[1])
-            
-            # Pair the nodes
-            node_input.pair_with_output(node_output)
-            
-            # Select both nodes in the pair for easy movement
-            node_input.select = True
-            node_output.select = True
-            tree.nodes.active = node_input
-            
-            return {'FINISHED'}
-        else:
-            self.report({'ERROR'}, "No active node tree found")
-            return {'CANCELLED'}
-
-# Function to draw nodes in a 2-column layout
-def draw_nodes_two_column(layout, nodes):
-    col = layout.column(align=True)
-    row = col.row()
+    def view(self, tree_type):
+        """Return the cached (recent, frequent, boosts) of tree_type"""
+        view = self._views.get(tree_type)
+        if view is None:
+            entries = [(node_type, entry) for (entry_tree, node_type), entry in self.entries.items()
+                       if entry_tree == tree_type]
+            recent = heapq.nlargest(USAGE_PANEL_SIZE, entries, key=lambda item: item[1][2])
+            frequent = heapq.nlargest(USAGE_PANEL_SIZE, entries, key=lambda item: self.decayed(item[1]))
+            boosts = {}
+            for node_type, entry in entries:
+                score = self.decayed(entry)
+                boosts[node_type] = USAGE_MAX_BOOST * score / (score + USAGE_BOOST_HALF)
+            view = self._views[tree_type] = (
+                tuple((node_type, entry[0]) for node_type, entry in recent),
+                tuple((node_type, entry[0]) for node_type, entry in frequent),
+                boosts,
+            )
+        return view
     
-    # Create two columns
-    col1 = row.column()
-    col2 = row.column()
+    def to_json(self):
+        return {
+            "tick": self.tick,
+            "entries": [[tree_type, node_type] + entry
+                        for (tree_type, node_type), entry in self.entries.items()],
+        }
     
-    # Distribute nodes between the two columns
-    for i, node in enumerate(nodes):
-        node_type, node_name = node
-        col = col1 if i % 2 == 0 else col2
-        
-        # Check if this is a custom operator or a regular node
+    def load(self, data):
+        self.tick = data["tick"]
+        self.entries = {(tree_type, node_type): [label, score, tick]
+                        for tree_type, node_type, label, score, tick in data["entries"]}
+        self._views.clear()
+
+USAGE_STATS = UsageStats()
+
+def get_usage_path():
+    return os.path.join(get_cache_dir(), "usage.json")
+
+def load_usage_stats():
+    try:
+        with open(get_usage_path(), encoding="utf-8") as f:
+            USAGE_STATS.load(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+def flush_usage_stats():
+    """Write the usage statistics if they changed since the last flush, also the flush timer"""
+    if USAGE_STATS.dirty:
+        path = get_usage_path()
+        try:
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(USAGE_STATS.to_json(), f, separators=(",", ":"))
+            os.replace(path + ".tmp", path)
+            USAGE_STATS.dirty = False
+        except OSError as error:
+            print(f"Quick Nodes: could not save usage statistics: {error}")
+    return None
+
+def record_usage(tree_type, node_type, label):
+    """Count an add of a catalog entry, written to disk later by the flush timer"""
+    # Loading the statistics later would drop this add
+    run_warmup_task("usage")
+    USAGE_STATS.record(tree_type, node_type, label)
+    # Rankings of this tree type include the usage boost
+    invalidate_search_cache(tree_type)
+    if not bpy.app.timers.is_registered(flush_usage_stats):
+        # Persistent, a file loaded in the meantime must not drop the pending write
+        bpy.app.timers.register(flush_usage_stats, first_interval=USAGE_FLUSH_DELAY, persistent=True)
+
+# FAVORITES
+# ============================================================================
+
+# Seconds between two checks of the favorites file for outside changes
+FAVORITES_CHECK_INTERVAL = 2.0
+
+class FavoritesStore:
+    """QuickNodes favorites per node tree type, kept in sync with favorites.json.
+
+    The file is stat'ed at most every FAVORITES_CHECK_INTERVAL seconds and only
+    re-read when its mtime changed, so it can be edited by hand or shared
+    between Blender sessions. Entries resolve to catalog (node_type, label)
+    pairs once per catalog view.
+    """
+    
+    def __init__(self):
+        self.entries = {}
+        self.mtime = None
+        self.checked = None
+        self._resolved = {}
+    
+    def refresh(self):
+        now = time.monotonic()
+        if self.checked is not None and now - self.checked < FAVORITES_CHECK_INTERVAL:
+            return
+        self.checked = now
+        path = get_favorites_path()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime == self.mtime:
+            return
+        
+        self.mtime = mtime
+        self.entries = {}
+        self._resolved.clear()
+        if mtime is None:
+            return
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.entries = {tree_type: [str(node_type) for node_type in node_types]
+                                for tree_type, node_types in json.load(f).items()}
+        except (OSError, ValueError, AttributeError, TypeError) as error:
+            print(f"Quick Nodes: could not read favorites: {error}")
+    
+    def get(self, tree_type):
+        """Return the favorites of tree_type as (node_type, label) catalog entries"""
+        self.refresh()
+        view = get_catalog_view(tree_type)
+        resolved = self._resolved.get(tree_type)
+        if resolved is None or resolved[0] is not view:
+            entries = (view.find(node_type) for node_type in self.entries.get(tree_type, ()))
+            nodes = tuple(entry.node for entry in entries if entry is not None)
+            resolved = self._resolved[tree_type] = (view, nodes)
+        return resolved[1]
+    
+    def contains(self, tree_type, node_type):
+        self.refresh()
+        return node_type in self.entries.get(tree_type, ())
+    
+    def set(self, tree_type, node_types):
+        """Replace the favorites of tree_type and write the file, raises OSError on failure"""
+        self.refresh()
+        entries = dict(self.entries)
+        if node_types:
+            entries[tree_type] = list(node_types)
+        else:
+            entries.pop(tree_type, None)
+        
+        path = get_favorites_path()
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=1)
+        os.replace(path + ".tmp", path)
+        
+        self.entries = entries
+        self.mtime = os.stat(path).st_mtime_ns
+        self._resolved.pop(tree_type, None)
+
+FAVORITES = FavoritesStore()
+
+def get_favorites_path():
+    return os.path.join(get_cache_dir(), "favorites.json")
+
+# Zone input or output node type -> zone operator class name, as listed in the catalog
+def catalog_entry_for_node(node):
+    for name, zone in ZONE_OPERATORS.items():
+        if node.bl_idname in (zone.zone_input, zone.zone_output):
+            return name
+    return node.bl_idname
+
+# NODE GROUPS
+# ============================================================================
+
+# Group node type of each tree type
+GROUP_NODE_TYPES = {
+    "GeometryNodeTree": "GeometryNodeGroup",
+    "ShaderNodeTree": "ShaderNodeGroup",
+    "CompositorNodeTree": "CompositorNodeGroup",
+    "TextureNodeTree": "TextureNodeGroup",
+}
+
+# Tree type -> (node_type, label, group name) of the node groups of that type
+_node_group_entries = {}
+# len(bpy.data.node_groups) when _node_group_entries was filled, a cheap check
+# for adds and deletes the handlers below may not see
+_node_group_count = None
+# Owner of the msgbus subscriptions catching renames
+_msgbus_owner = object()
+
+@persistent
+def invalidate_node_groups(*args):
+    global _node_group_count
+    _node_group_entries.clear()
+    _node_group_count = None
+
+def get_node_group_entries(tree_type):
+    """Return the cached group entries of tree_type, rebuilt when groups were added, removed or renamed"""
+    global _node_group_count
+    node_groups = bpy.data.node_groups
+    if len(node_groups) != _node_group_count:
+        _node_group_entries.clear()
+        _node_group_count = len(node_groups)
+    
+    entries = _node_group_entries.get(tree_type)
+    if entries is None:
+        group_node_type = GROUP_NODE_TYPES.get(tree_type)
+        # Groups starting with a dot are hidden by Blender too
+        names = sorted((group.name for group in node_groups
+                        if group.bl_idname == tree_type and not group.name.startswith(".")),
+                       key=str.lower)
+        entries = _node_group_entries[tree_type] = tuple(
+            (group_node_type, name, name) for name in names) if group_node_type else ()
+    return entries
+
+def subscribe_node_group_renames():
+    # msgbus matches the exact struct type, so every tree type is subscribed on its own
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for tree_type in GROUP_NODE_TYPES:
+        struct = getattr(bpy.types, tree_type, None)
+        if struct is None:
+            continue
+        bpy.msgbus.subscribe_rna(
+            key=(struct, "name"),
+            owner=_msgbus_owner,
+            args=(),
+            notify=invalidate_node_groups,
+        )
+
+@persistent
+def node_groups_load_post(*args):
+    # Loading a file drops msgbus subscriptions
+    invalidate_node_groups()
+    subscribe_node_group_renames()
+
+@persistent
+def node_groups_depsgraph_update_post(scene, depsgraph):
+    # Adding, deleting or editing a node tree, a delete plus an add keeps the count
+    if depsgraph.id_type_updated('NODETREE'):
+        invalidate_node_groups()
+
+# ASSET LIBRARIES
+# ============================================================================
+
+# Seconds of work per timer step while indexing, and pause between steps
+LIBRARY_SCAN_BUDGET = 0.01
+LIBRARY_SCAN_INTERVAL = 0.05
+# Library results shown under the catalog results of a search
+LIBRARY_SEARCH_LIMIT = 10
+
+class AssetLibraryIndex:
+    """Node groups found in the .blend files of the asset library folders.
+
+    files maps each .blend path to {"mtime": st_mtime_ns, "groups": {name: tree_type}}
+    and is persisted, so a scan only opens the files that changed since. Blender
+    can list the group names of a file without loading it, but not their tree
+    type: it stays "" until the group is first appended or linked. Until then
+    a group is only offered in UNKNOWN_GROUP_TREE_TYPE editors, where nearly
+    every library group belongs.
+    """
+    UNKNOWN_GROUP_TREE_TYPE = "GeometryNodeTree"
+    
+    def __init__(self):
+        self.files = {}
+        self.dirty = False
+        self.scanned = 0
+        # Tree type -> entries, and -> NodeSearchIndex of those entries
+        self._entries = {}
+        self._indexes = {}
+    
+    # The entries and search indexes are kept until rebuilt by view_steps(),
+    # drawing during a scan must not redo them after every file
+    def set_groups(self, path, mtime, names):
+        known = self.files.get(path, {}).get("groups", {})
+        self.files[path] = {"mtime": mtime, "groups": {name: known.get(name, "") for name in names}}
+        self.dirty = True
+    
+    def set_tree_type(self, path, name, tree_type):
+        """Record the tree type of a group, return True if it changed"""
+        groups = self.files.get(path, {}).get("groups")
+        if groups is None or groups.get(name) == tree_type:
+            return False
+        groups[name] = tree_type
+        self.dirty = True
+        return True
+    
+    def drop_missing(self, paths):
+        for path in set(self.files) - paths:
+            del self.files[path]
+            self.dirty = True
+    
+    def collect_entries(self, tree_type):
+        """Return the (key, label) entries of the groups usable in tree_type, key as from library_key()"""
+        types = (tree_type, "") if tree_type == self.UNKNOWN_GROUP_TREE_TYPE else (tree_type,)
+        groups = [(path, name) for path, info in sorted(self.files.items())
+                  for name, group_type in sorted(info["groups"].items())
+                  if not name.startswith(".") and group_type in types]
+        # Groups found in several files are told apart by file name
+        counts = {}
+        for _, name in groups:
+            counts[name] = counts.get(name, 0) + 1
+        entries = []
+        for path, name in groups:
+            label = name if counts[name] == 1 else f"{name} ({os.path.splitext(os.path.basename(path))[0]})"
+            entries.append((library_key(path, name), label))
+        return entries
+    
+    def entries(self, tree_type):
+        """Return the cached entries of tree_type, collected on first use"""
+        entries = self._entries.get(tree_type)
+        if entries is None:
+            entries = self._entries[tree_type] = self.collect_entries(tree_type)
+        return entries
+    
+    def search_index(self, tree_type):
+        """Return the search index of tree_type, None until view_steps() built it"""
+        return self._indexes.get(tree_type)
+    
+    def view_steps(self):
+        """Rebuild the entries and search indexes of every group tree type, yielding between chunks.
+
+        The previous ones are served until all new ones are complete.
+        """
+        entries = {}
+        for tree_type in GROUP_NODE_TYPES:
+            entries[tree_type] = self.collect_entries(tree_type)
+            yield
+        indexes = {}
+        for tree_type, tree_entries in entries.items():
+            index = indexes[tree_type] = NodeSearchIndex(tree_entries, build=False)
+            yield from index.index_steps()
+        self._entries = entries
+        self._indexes = indexes
+
+ASSET_LIBRARY_INDEX = AssetLibraryIndex()
+# Running scan generator, None when idle
+_library_scan = None
+# Whether the running scan looks at the files, or only rebuilds the entries and search indexes
+_library_scan_files = False
+
+def library_key(path, name):
+    return f"{path}::{name}"
+
+def split_library_key(key):
+    path, _, name = key.rpartition("::")
+    return path, name
+
+def get_library_cache_path():
+    return os.path.join(get_cache_dir(), "asset_libraries.json")
+
+def load_library_index():
+    try:
+        with open(get_library_cache_path(), encoding="utf-8") as f:
+            ASSET_LIBRARY_INDEX.files = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+def save_library_index():
+    if not ASSET_LIBRARY_INDEX.dirty:
+        return
+    try:
+        with open(get_library_cache_path(), "w", encoding="utf-8") as f:
+            json.dump(ASSET_LIBRARY_INDEX.files, f, separators=(",", ":"))
+        ASSET_LIBRARY_INDEX.dirty = False
+    except OSError as error:
+        print(f"Quick Nodes: could not save the asset library index: {error}")
+
+def read_library_group_names(path):
+    """Return the node group names stored in the .blend file at path, without loading them"""
+    try:
+        with bpy.data.libraries.load(path) as (data_from, data_to):
+            return list(data_from.node_groups)
+    except (OSError, RuntimeError) as error:
+        print(f"Quick Nodes: could not index {path}: {error}")
+        return []
+
+def scan_asset_libraries():
+    """Index the asset library folders, yielding after each file so the work can be sliced.
+
+    Reading the names of one file can't be interrupted, so a step may run
+    past its budget on a large .blend.
+    """
+    seen = set()
+    for library in bpy.context.preferences.filepaths.asset_libraries:
+        for root, dirs, files in os.walk(bpy.path.abspath(library.path)):
+            for filename in files:
+                if not filename.endswith(".blend"):
+                    continue
+                path = os.path.join(root, filename)
+                seen.add(path)
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                if ASSET_LIBRARY_INDEX.files.get(path, {}).get("mtime") != mtime:
+                    ASSET_LIBRARY_INDEX.set_groups(path, mtime, read_library_group_names(path))
+                ASSET_LIBRARY_INDEX.scanned += 1
+                yield
+            yield
+    ASSET_LIBRARY_INDEX.drop_missing(seen)
+    yield from ASSET_LIBRARY_INDEX.view_steps()
+
+def library_scan_step():
+    """Timer running the scan for LIBRARY_SCAN_BUDGET seconds at a time"""
+    global _library_scan
+    if _library_scan is None:
+        return None
+    deadline = time.perf_counter() + LIBRARY_SCAN_BUDGET
+    try:
+        while time.perf_counter() < deadline:
+            next(_library_scan)
+    except StopIteration:
+        stop_library_scan()
+        invalidate_search_cache()
+        tag_node_editor_redraw()
+        return None
+    return LIBRARY_SCAN_INTERVAL
+
+def start_library_scan(first_interval=0.0, rescan=True):
+    """Start indexing the asset libraries in the background, unless a scan is running.
+
+    Without rescan the files aren't looked at, only the entries and search
+    indexes are rebuilt from the index.
+    """
+    global _library_scan, _library_scan_files
+    if _library_scan is not None and (_library_scan_files or not rescan):
+        return
+    if rescan:
+        ASSET_LIBRARY_INDEX.scanned = 0
+    _library_scan = scan_asset_libraries() if rescan else ASSET_LIBRARY_INDEX.view_steps()
+    _library_scan_files = rescan
+    if not bpy.app.timers.is_registered(library_scan_step):
+        # Persistent, a scan left without its timer by a file load would never end
+        bpy.app.timers.register(library_scan_step, first_interval=first_interval, persistent=True)
+
+def stop_library_scan():
+    global _library_scan, _library_scan_files
+    if bpy.app.timers.is_registered(library_scan_step):
+        bpy.app.timers.unregister(library_scan_step)
+    _library_scan = None
+    _library_scan_files = False
+    save_library_index()
+
+@persistent
+def library_load_post(*args):
+    # Start over a scan that lost its timer anyway, it would block every later one
+    if _library_scan is not None and not bpy.app.timers.is_registered(library_scan_step):
+        rescan = _library_scan_files
+        stop_library_scan()
+        start_library_scan(rescan=rescan)
+
+def get_library_search_results(query, tree_type):
+    """Return (total, results) of the asset library groups matching query, best first"""
+    key = ("library", query.lower(), tree_type)
+    results = _search_cache.get(key)
+    if results is None:
+        index = ASSET_LIBRARY_INDEX.search_index(tree_type)
+        if index is None:
+            # Built in the background, the results show up once it is done
+            return 0, ()
+        total, nodes = index.search(query, LIBRARY_SEARCH_LIMIT)
+        results = _search_cache[key] = (total, tuple(nodes))
+        if len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+    return results
+
+# Draw asset library groups in two columns, entries are (key, label)
+def draw_library_groups(layout, entries):
+    row = layout.column(align=True).row()
+    columns = (row.column(), row.column())
+    for i, (key, label) in enumerate(entries):
+        path, name = split_library_key(key)
+        op = columns[i % 2].operator("quicknodes.add_library_group", text=label, icon='ASSET_MANAGER')
+        op.filepath = path
+        op.group_name = name
+
+# PROFILING
+# ============================================================================
+
+# Samples kept per panel or operator
+PROFILE_BUFFER_SIZE = 256
+
+class TimingRing:
+    """Fixed-size ring buffer of durations in milliseconds"""
+    __slots__ = ("samples", "index", "count")
+    
+    def __init__(self, size=PROFILE_BUFFER_SIZE):
+        self.samples = array("d", [0.0]) * size
+        self.index = 0
+        self.count = 0
+    
+    def add(self, value):
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % len(self.samples)
+        self.count += 1
+    
+    def values(self):
+        """Return the kept samples, oldest first"""
+        if self.count < len(self.samples):
+            return self.samples[:self.count].tolist()
+        return (self.samples[self.index:] + self.samples[:self.index]).tolist()
+    
+    def stats(self):
+        """Return (calls, p50, p95, max) over the kept samples"""
+        values = sorted(self.values())
+        if not values:
+            return self.count, 0.0, 0.0, 0.0
+        p50 = values[(len(values) - 1) // 2]
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        return self.count, p50, p95, values[-1]
+
+# "draw <panel>" / "execute <operator>" -> TimingRing
+_profile_timings = {}
+_profiling_enabled = False
+
+def profiled(func):
+    """Record the duration of a panel draw or operator execute while profiling is on"""
+    # Blender checks the argument count of draw and execute when registering,
+    # the wrapper has to take exactly (self, context) like the functions it wraps
+    @functools.wraps(func)
+    def wrapper(self, context):
+        if not _profiling_enabled:
+            return func(self, context)
+        start = time.perf_counter()
+        try:
+            return func(self, context)
+        finally:
+            key = f"{func.__name__} {self.bl_idname}"
+            ring = _profile_timings.get(key)
+            if ring is None:
+                ring = _profile_timings[key] = TimingRing()
+            ring.add((time.perf_counter() - start) * 1000.0)
+    return wrapper
+
+def set_profiling(enabled):
+    global _profiling_enabled
+    _profiling_enabled = enabled
+
+def get_profile_stats():
+    """Return [(name, calls, p50, p95, max)] sorted by name"""
+    return [(name,) + ring.stats() for name, ring in sorted(_profile_timings.items())]
+
+def export_profile(filepath):
+    """Write the stats, and for JSON the raw samples, to a .csv or .json file"""
+    if filepath.lower().endswith(".json"):
+        data = {
+            "blender": ".".join(str(part) for part in bpy.app.version),
+            "version": ".".join(str(part) for part in bl_info["version"]),
+            "timings": {
+                name: {"calls": calls, "p50": p50, "p95": p95, "max": peak,
+                       "samples": _profile_timings[name].values()}
+                for name, calls, p50, p95, peak in get_profile_stats()
+            },
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+    else:
+        with open(filepath, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("name", "calls", "p50_ms", "p95_ms", "max_ms"))
+            for name, calls, p50, p95, peak in get_profile_stats():
+                writer.writerow((name, calls, f"{p50:.4f}", f"{p95:.4f}", f"{peak:.4f}"))
+
+# GENERATED CATALOG
+# ============================================================================
+
+# Category holding generated node types the overrides don't place anywhere
+GENERATED_CATEGORY = "MORE"
+# Generated node types are grouped by the prefix of their bl_idname, per tree type
+GENERATED_FAMILIES = {
+    "GeometryNodeTree": {"GeometryNode": "Geometry", "FunctionNode": "Function"},
+    "ShaderNodeTree": {"ShaderNode": "Shader"},
+    "CompositorNodeTree": {"CompositorNode": "Compositor"},
+    "TextureNodeTree": {"TextureNode": "Texture"},
+}
+# Abstract bases and node types that can't be added on their own
+EXCLUDED_NODE_TYPES = {
+    "NodeInternal",
+    "NodeUndefined",
+    "NodeGroup",
+    "NodeCustomGroup",
+    "GeometryNode",
+    "GeometryNodeGroup",
+    "GeometryNodeCustomGroup",
+    "FunctionNode",
+    "ShaderNode",
+    "ShaderNodeGroup",
+    "ShaderNodeCustomGroup",
+    "CompositorNode",
+    "CompositorNodeGroup",
+    "CompositorNodeCustomGroup",
+    "TextureNode",
+    "TextureNodeGroup",
+}
+
+def get_cache_dir():
+    """Return the QuickNodes folder in the user config directory"""
+    return bpy.utils.user_resource('CONFIG', path="quick_nodes", create=True)
+
+def get_catalog_cache_path():
+    version = ".".join(str(part) for part in bpy.app.version)
+    return os.path.join(get_cache_dir(), f"node_catalog_{version}.json")
+
+def get_build_hash():
+    build_hash = getattr(bpy.app, "build_hash", b"")
+    return build_hash.decode() if isinstance(build_hash, bytes) else str(build_hash)
+
+# bpy.types names looked at between two yields of introspect_node_types_steps()
+INTROSPECT_CHUNK = 250
+
+def introspect_node_types_steps():
+    """Generator returning {bl_idname: label} for every node type registered in the running Blender"""
+    node_types = {}
+    for i, name in enumerate(dir(bpy.types)):
+        if i % INTROSPECT_CHUNK == INTROSPECT_CHUNK - 1:
+            yield
+        cls = getattr(bpy.types, name, None)
+        if not isinstance(cls, type) or not issubclass(cls, bpy.types.Node):
+            continue
+        bl_rna = getattr(cls, "bl_rna", None)
+        if bl_rna is None or bl_rna.identifier != name or name in EXCLUDED_NODE_TYPES:
+            continue
+        node_types[name] = bl_rna.name
+    return node_types
+
+def load_generated_catalog_steps():
+    """Generator returning the generated {bl_idname: label}, from the disk cache when it matches this build"""
+    path = get_catalog_cache_path()
+    build_hash = get_build_hash()
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("build_hash") == build_hash:
+            return cached["nodes"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    node_types = yield from introspect_node_types_steps()
+    yield
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"build_hash": build_hash, "nodes": node_types}, f, separators=(",", ":"))
+    except OSError:
+        pass
+    return node_types
+
+def merge_generated_catalog(overrides, generated, families):
+    """Return overrides plus the generated node types of families they don't mention"""
+    categories = dict(overrides)
+    placed = {node_type for node_type, _ in flatten_catalog(overrides)}
+    placed.update(zone.zone_input for zone in ZONE_OPERATORS.values())
+    placed.update(zone.zone_output for zone in ZONE_OPERATORS.values())
+
+    more = {}
+    for node_type, label in sorted(generated.items(), key=lambda item: item[1]):
+        if node_type in placed:
+            continue
+        for prefix, family in families.items():
+            if node_type.startswith(prefix):
+                more.setdefault(family, []).append((node_type, label))
+                break
+    if more:
+        categories[GENERATED_CATEGORY] = more
+    return categories
+
+# NODE AVAILABILITY
+# ============================================================================
+
+# Catalog node type -> True if the running Blender can create it
+NODE_AVAILABILITY = {}
+
+def resolve_node_availability(generated):
+    """Resolve every override entry against the generated node types of this build"""
+    availability = {}
+    for node_type, _ in (node for categories in TREE_CATALOG_OVERRIDES.values()
+                         for node in flatten_catalog(categories)):
+        zone = ZONE_OPERATORS.get(node_type)
+        if zone is not None:
+            availability[node_type] = zone.zone_input in generated and zone.zone_output in generated
+        else:
+            availability[node_type] = node_type in generated
+    return availability
+
+def get_unresolved_node_types():
+    return sorted(node_type for node_type, available in NODE_AVAILABILITY.items() if not available)
+
+def prune_unavailable(categories):
+    """Return categories without the entries the running Blender can't create"""
+    def keep(nodes):
+        return [node for node in nodes if NODE_AVAILABILITY.get(node[0], True)]
+    
+    pruned = {}
+    for category, content in categories.items():
+        if isinstance(content, dict):
+            pruned[category] = {sub: keep(nodes) for sub, nodes in content.items()}
+        else:
+            pruned[category] = keep(content)
+    return pruned
+
+class QUICKNODES_OT_report_unresolved(Operator):
+    bl_idname = "quicknodes.report_unresolved"
+    bl_label = "Report Unavailable Nodes"
+    bl_description = "List the catalog node types that don't exist in this Blender"
+    
+    @profiled
+    def execute(self, context):
+        unresolved = get_unresolved_node_types()
+        if unresolved:
+            self.report({'WARNING'}, f"Unavailable node types: {', '.join(unresolved)}")
+        else:
+            self.report({'INFO'}, "All catalog node types are available")
+        return {'FINISHED'}
+
+# Generated {bl_idname: label} of this Blender build, empty until prepare_node_catalog()
+_generated_catalog = {}
+
+# Run a generator split in steps to the end and return its value
+def run_steps(steps):
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+def prepare_node_catalog():
+    """Load the generated catalog and resolve availability, dropping the catalog views built from the old one"""
+    run_steps(prepare_node_catalog_steps())
+
+def prepare_node_catalog_steps():
+    global _generated_catalog
+    _generated_catalog = yield from load_generated_catalog_steps()
+    NODE_AVAILABILITY.clear()
+    NODE_AVAILABILITY.update(resolve_node_availability(_generated_catalog))
+    unresolved = get_unresolved_node_types()
+    if unresolved:
+        print(f"Quick Nodes: {len(unresolved)} catalog node types are unavailable: {', '.join(unresolved)}")
+    CATALOG_VIEWS.clear()
+    _panel_visibility.clear()
+    invalidate_search_cache()
+
+def build_catalog_view(tree_type):
+    """Build the catalog view of tree_type from the generated catalog and the overrides"""
+    return run_steps(build_catalog_view_steps(tree_type))
+
+def build_catalog_view_steps(tree_type):
+    """Generator returning the new catalog view of tree_type, published once its search index is filled"""
+    prefs = get_preferences()
+    hide = prefs is None or prefs.unavailable_nodes == 'HIDE'
+    categories = merge_generated_catalog(
+        TREE_CATALOG_OVERRIDES[tree_type], _generated_catalog, GENERATED_FAMILIES[tree_type])
+    if hide:
+        categories = prune_unavailable(categories)
+    view = CatalogView(tree_type, categories, build_index=False)
+    yield
+    yield from view.search_index.index_steps()
+    CATALOG_VIEWS[tree_type] = view
+    for entry in view.repeated_entries():
+        print(f"Quick Nodes: {entry.node_type} is listed twice in {' > '.join(entry.path)}")
+    _panel_visibility.clear()
+    invalidate_search_cache()
+    return view
+
+def load_node_catalog():
+    """Rebuild the catalog view of every tree type from the generated catalog and the overrides"""
+    prepare_node_catalog()
+    for tree_type in TREE_CATALOG_OVERRIDES:
+        build_catalog_view(tree_type)
+
+# WARM-UP
+# ============================================================================
+
+# Seconds of warm-up work per timer step, and pause between steps
+WARMUP_BUDGET = 0.008
+WARMUP_INTERVAL = 0.02
+
+class WarmupTask:
+    """One cache built by the warm-up, timed while it runs.
+
+    A function returning a generator is run a step at a time, so one large
+    cache is spread over several timer steps instead of blowing the budget.
+    """
+    __slots__ = ("label", "function", "duration", "elapsed", "steps", "running")
+    
+    def __init__(self, label, function):
+        self.label = label
+        self.function = function
+        # Milliseconds, None while pending
+        self.duration = None
+        self.elapsed = 0.0
+        # Generator of a started task, None before it starts
+        self.steps = None
+        self.running = False
+    
+    def advance(self, deadline=None):
+        """Run the task to its end, or until deadline between two steps. Return True once done"""
+        if self.duration is not None:
+            return True
+        # Needed by itself on demand, it can only go on once the outer call returns
+        if self.running:
+            return False
+        self.running = True
+        start = time.perf_counter()
+        done = False
+        try:
+            if self.steps is None:
+                steps = self.function()
+                self.steps = steps if isinstance(steps, GeneratorType) else iter(())
+            for _ in self.steps:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+            else:
+                done = True
+        except Exception:
+            # A failed task is not retried at every step
+            done = True
+            raise
+        finally:
+            self.running = False
+            self.elapsed += (time.perf_counter() - start) * 1000.0
+            if done:
+                self.steps = None
+                self.duration = self.elapsed
+        return done
+
+# Task key -> WarmupTask, in the order they run
+_warmup_tasks = OrderedDict()
+
+def warm_node_groups():
+    for tree_type in GROUP_NODE_TYPES:
+        get_node_group_entries(tree_type)
+
+def warm_catalog_view(tree_type):
+    # Built on demand already
+    if tree_type not in CATALOG_VIEWS:
+        yield from build_catalog_view_steps(tree_type)
+
+def warm_asset_libraries():
+    load_library_index()
+    prefs = get_preferences()
+    start_library_scan(rescan=prefs is None or prefs.index_libraries)
+
+def schedule_warmup(first_interval=0.5):
+    """Build the QuickNodes caches in budgeted timer steps once Blender is up"""
+    _warmup_tasks.clear()
+    _warmup_tasks["node_types"] = WarmupTask("Node types", prepare_node_catalog_steps)
+    for tree_type in TREE_CATALOG_OVERRIDES:
+        _warmup_tasks["catalog " + tree_type] = WarmupTask(
+            f"Catalog: {tree_type}", functools.partial(warm_catalog_view, tree_type))
+    _warmup_tasks["usage"] = WarmupTask("Usage statistics", load_usage_stats)
+    _warmup_tasks["favorites"] = WarmupTask("Favorites", FAVORITES.refresh)
+    _warmup_tasks["node_groups"] = WarmupTask("Node groups", warm_node_groups)
+    _warmup_tasks["libraries"] = WarmupTask("Asset library index", warm_asset_libraries)
+    if not bpy.app.timers.is_registered(warmup_step):
+        # Persistent, Blender drops other timers when a file loads, also the
+        # one given on the command line, which loads after add-ons register
+        bpy.app.timers.register(warmup_step, first_interval=first_interval, persistent=True)
+
+def run_warmup_task(key):
+    """Run a warm-up task now if it is still pending, for caches needed before the warm-up built them"""
+    task = _warmup_tasks.get(key)
+    if task is not None:
+        task.advance()
+
+def warmup_step():
+    """Timer running pending warm-up tasks for WARMUP_BUDGET seconds at a time.
+
+    The budget is checked between the steps of a task, a step itself (one
+    chunk of nodes, reading one cache file) can't be interrupted.
+    """
+    deadline = time.perf_counter() + WARMUP_BUDGET
+    for task in _warmup_tasks.values():
+        if task.duration is not None:
+            continue
+        if time.perf_counter() >= deadline or not task.advance(deadline):
+            tag_node_editor_redraw()
+            return WARMUP_INTERVAL
+    tag_node_editor_redraw()
+    return None
+
+def get_warmup_progress():
+    """Return (done, total) warm-up tasks"""
+    done = sum(1 for task in _warmup_tasks.values() if task.duration is not None)
+    return done, len(_warmup_tasks)
+
+def cancel_warmup():
+    if bpy.app.timers.is_registered(warmup_step):
+        bpy.app.timers.unregister(warmup_step)
+    _warmup_tasks.clear()
+
+def get_edit_tree_type(context):
+    """Return the bl_idname of the tree being edited, or an empty string"""
+    space = context.space_data
+    if space and space.type == 'NODE_EDITOR' and space.edit_tree:
+        return space.edit_tree.bl_idname
+    return ""
+
+def update_search_filter(self, context):
+    # A new query starts on its first page
+    if self.search_page:
+        self.search_page = 0
+    # Compute the results once per edit so draw() only has to render them.
+    # Editing the property redraws every editor anyway, the others only
+    # render their own cached results.
+    if self.search_filter:
+        get_search_results(self.search_filter, get_edit_tree_type(context))
+
+# PER-EDITOR SEARCH STATE
+# ============================================================================
+
+# (screen name, area key) of the search states waiting for their timer
+_pending_search_states = set()
+
+# Areas are told apart by pointer, stable while the file is open
+def get_area_key(area):
+    return str(area.as_pointer())
+
+def get_search_state(context):
+    """Return the search state of the Node Editor area of context, None until it is created"""
+    screen = context.screen
+    area = context.area
+    if screen is None or area is None:
+        return None
+    return screen.quick_nodes_searches.get(get_area_key(area))
+
+def request_search_state(context):
+    """Create the search state of the area of context from a timer, ID data can't be written in draw()"""
+    screen_name = context.screen.name
+    key = get_area_key(context.area)
+    if (screen_name, key) in _pending_search_states:
+        return
+    _pending_search_states.add((screen_name, key))
+    
+    def create():
+        _pending_search_states.discard((screen_name, key))
+        screen = bpy.data.screens.get(screen_name)
+        if screen is None:
+            return None
+        areas = {get_area_key(area): area for area in screen.areas}
+        states = screen.quick_nodes_searches
+        # Drop the states of areas closed since
+        for i in reversed(range(len(states))):
+            if states[i].name not in areas:
+                states.remove(i)
+        if key in areas and states.get(key) is None:
+            states.add().name = key
+            areas[key].tag_redraw()
+        return None
+    
+    bpy.app.timers.register(create, first_interval=0.0)
+
+@persistent
+def search_state_load_post(*args):
+    # Area pointers of the loaded file don't match the saved keys
+    _pending_search_states.clear()
+    for screen in bpy.data.screens:
+        states = getattr(screen, "quick_nodes_searches", None)
+        if states is not None:
+            states.clear()
+
+# STAGING MODE
+# ============================================================================
+
+def tree_uses_group(tree, group, visited=None):
+    """Return True if tree is group or contains a group node using it, at any depth"""
+    if tree == group:
+        return True
+    if visited is None:
+        visited = set()
+    if tree.name in visited:
+        return False
+    visited.add(tree.name)
+    for node in tree.nodes:
+        sub_tree = getattr(node, "node_tree", None)
+        if sub_tree is not None and tree_uses_group(sub_tree, group, visited):
+            return True
+    return False
+
+def suspend_tree_evaluation(props, tree):
+    """Hide the viewport result of every Geometry Nodes modifier that evaluates tree"""
+    staged = {(item.object_name, item.modifier_name) for item in props.staged_modifiers}
+    for obj in bpy.data.objects:
+        for modifier in obj.modifiers:
+            if modifier.type != 'NODES' or modifier.node_group is None:
+                continue
+            if (obj.name, modifier.name) in staged or not tree_uses_group(modifier.node_group, tree):
+                continue
+            item = props.staged_modifiers.add()
+            item.object_name = obj.name
+            item.modifier_name = modifier.name
+            item.show_viewport = modifier.show_viewport
+            modifier.show_viewport = False
+
+def set_staged_modifiers_visible(props, visible):
+    """Show the staged modifiers as they were before staging, or hide them again"""
+    for item in props.staged_modifiers:
+        obj = bpy.data.objects.get(item.object_name)
+        modifier = obj.modifiers.get(item.modifier_name) if obj else None
+        if modifier is not None:
+            modifier.show_viewport = item.show_viewport if visible else False
+
+def stage_tree(context, tree):
+    """Track tree as edited while staging and suspend its evaluation on first touch"""
+    props = getattr(context.scene, 'quick_nodes_props', None)
+    if props is None or not props.staging_mode or props.staged_trees.get(tree.name) is not None:
+        return
+    props.staged_trees.add().name = tree.name
+    suspend_tree_evaluation(props, tree)
+
+def end_staging(props):
+    """Show the staged modifiers again, which triggers their single re-evaluation"""
+    set_staged_modifiers_visible(props, True)
+    props.staged_modifiers.clear()
+    props.staged_trees.clear()
+
+def scene_quick_nodes_props():
+    """Yield the Quick Nodes properties of every scene"""
+    for scene in bpy.data.scenes:
+        props = getattr(scene, 'quick_nodes_props', None)
+        if props is not None:
+            yield props
+
+def update_staging_mode(self, context):
+    if self.staging_mode:
+        space = context.space_data
+        if space and space.type == 'NODE_EDITOR' and space.edit_tree:
+            stage_tree(context, space.edit_tree)
+    else:
+        end_staging(self)
+
+@persistent
+def staging_save_pre(*args):
+    # Never write the temporarily hidden modifiers to disk
+    for props in scene_quick_nodes_props():
+        set_staged_modifiers_visible(props, True)
+
+@persistent
+def staging_save_post(*args):
+    for props in scene_quick_nodes_props():
+        set_staged_modifiers_visible(props, False)
+
+@persistent
+def staging_load_post(*args):
+    # Staging ends with the session, a file written without save_pre,
+    # such as an autosave, still gets its modifiers back
+    for props in scene_quick_nodes_props():
+        end_staging(props)
+        if props.staging_mode:
+            props.staging_mode = False
+
+# A Geometry Nodes modifier hidden while staging and its show_viewport before
+class QuickNodesStagedModifier(PropertyGroup):
+    object_name: StringProperty()
+    modifier_name: StringProperty()
+    show_viewport: BoolProperty()
+
+# A node tree edited while staging, named after the tree
+class QuickNodesStagedTree(PropertyGroup):
+    pass
+
+# A node type queued in the basket
+class QuickNodesBasketItem(PropertyGroup):
+    node_type: StringProperty()
+    label: StringProperty()
+
+# Search state of one Node Editor area, named after the area key
+class QuickNodesSearchState(PropertyGroup):
+    search_filter: StringProperty(
+        name="Search Filter",
+        description="Filter nodes by name",
+        default="",
+        update=update_search_filter
+    )
+    search_page: IntProperty(
+        name="Search Page",
+        description="Page of the search results shown",
+        default=0,
+        min=0
+    )
+
+# Scene-wide Quick Nodes properties
+class QuickNodesProperties(PropertyGroup):
+    basket_mode: BoolProperty(
+        name="Basket Mode",
+        description="Queue tapped nodes in a basket and add them all at once",
+        default=False
+    )
+    basket: CollectionProperty(type=QuickNodesBasketItem)
+    staging_mode: BoolProperty(
+        name="Staging Mode",
+        description="Suspend Geometry Nodes modifiers using the edited trees until staging ends",
+        default=False,
+        update=update_staging_mode
+    )
+    # Staging state lives in the file, so undo and redo keep it in step with the modifiers
+    staged_modifiers: CollectionProperty(type=QuickNodesStagedModifier)
+    staged_trees: CollectionProperty(type=QuickNodesStagedTree)
+    connect_mode: EnumProperty(
+        name="Connect",
+        description="How new nodes are linked to the active node",
+        items=[
+            ('NONE', "Off", "Add nodes without linking them"),
+            ('ACTIVE', "To Active", "Link the active node's output to the new node"),
+            ('INSERT', "Insert", "Insert the new node between the active node and the nodes it feeds"),
+        ],
+        default='NONE'
+    )
+
+# Function to deselect all nodes
+def deselect_all_nodes(context):
+    """Deselect all nodes in the current node tree"""
+    space = context.space_data
+    if space.type == 'NODE_EDITOR' and space.edit_tree:
+        nodes = space.edit_tree.nodes
+        try:
+            # Clear the whole selection in one RNA call instead of one write per node
+            nodes.foreach_set("select", [False] * len(nodes))
+        except (AttributeError, TypeError, RuntimeError):
+            for node in nodes:
+                node.select = False
+
+# Queue a node type in the basket instead of adding it, returns True if queued
+def queue_in_basket(context, node_type, label):
+    props = getattr(context.scene, 'quick_nodes_props', None)
+    if props is None or not props.basket_mode:
+        return False
+    item = props.basket.add()
+    item.node_type = node_type
+    item.label = label or node_type
+    return True
+
+# NODE PLACEMENT
+# ============================================================================
+
+# Size assumed for nodes Blender hasn't drawn yet
+DEFAULT_NODE_WIDTH = 140.0
+DEFAULT_NODE_HEIGHT = 200.0
+# Width of a zone, input and output node side by side
+ZONE_WIDTH = 200.0 + DEFAULT_NODE_WIDTH
+# Space kept free around placed nodes
+PLACEMENT_MARGIN = 40.0
+# How many slots away from the preferred spot to look for free space
+PLACEMENT_SEARCH_RADIUS = 12
+
+# Candidate offsets in slots, nearest first, then straight down before sideways
+PLACEMENT_OFFSETS = sorted(
+    ((dx, dy)
+     for dx in range(-PLACEMENT_SEARCH_RADIUS, PLACEMENT_SEARCH_RADIUS + 1)
+     for dy in range(-PLACEMENT_SEARCH_RADIUS, PLACEMENT_SEARCH_RADIUS + 1)),
+    key=lambda offset: (offset[0] * offset[0] + offset[1] * offset[1], abs(offset[0]), offset[1]),
+)
+
+def read_node_floats(nodes, attr, size):
+    """Read a float property of every node in one foreach_get call"""
+    values = array("f", [0.0]) * (len(nodes) * size)
+    try:
+        nodes.foreach_get(attr, values)
+    except (AttributeError, TypeError, RuntimeError):
+        for i, node in enumerate(nodes):
+            value = getattr(node, attr)
+            if size == 1:
+                values[i] = value
+            else:
+                values[i * size:(i + 1) * size] = array("f", value)
+    return values
+
+class NodeSpatialIndex:
+    """Spatial hash of node bounding boxes, used to find free space for new nodes.
+
+    Boxes are (left, bottom, right, top) in node editor space, stored in every
+    grid cell they overlap. locations mirrors the flat location array of the
+    tree the index was built from, so any add, move or delete made outside
+    QuickNodes is detected with a single comparison.
+    """
+    CELL_SIZE = 256.0
+    
+    def __init__(self, locations):
+        self.cells = {}
+        self.locations = locations
+    
+    @classmethod
+    def from_tree(cls, tree, locations):
+        index = cls(locations)
+        nodes = tree.nodes
+        widths = read_node_floats(nodes, "width", 1)
+        dimensions = read_node_floats(nodes, "dimensions", 2)
+        for i in range(len(nodes)):
+            x = locations[2 * i]
+            y = locations[2 * i + 1]
+            height = dimensions[2 * i + 1] or DEFAULT_NODE_HEIGHT
+            index.insert((x, y - height, x + (widths[i] or DEFAULT_NODE_WIDTH), y))
+        return index
+    
+    def covered_cells(self, box):
+        size = self.CELL_SIZE
+        for cx in range(int(box[0] // size), int(box[2] // size) + 1):
+            for cy in range(int(box[1] // size), int(box[3] // size) + 1):
+                yield cx, cy
+    
+    def insert(self, box):
+        for cell in self.covered_cells(box):
+            self.cells.setdefault(cell, []).append(box)
+    
+    def is_free(self, box):
+        left, bottom, right, top = box
+        for cell in self.covered_cells(box):
+            for other in self.cells.get(cell, ()):
+                if left < other[2] and other[0] < right and bottom < other[3] and other[1] < top:
+                    return False
+        return True
+
+# Tree pointer -> NodeSpatialIndex
+_spatial_indexes = {}
+
+def get_spatial_index(tree):
+    """Return the spatial index of tree, rebuilt only if its nodes changed outside QuickNodes"""
+    locations = read_node_floats(tree.nodes, "location", 2)
+    key = tree.as_pointer()
+    index = _spatial_indexes.get(key)
+    if index is None or index.locations != locations:
+        index = _spatial_indexes[key] = NodeSpatialIndex.from_tree(tree, locations)
+    return index
+
+def reserve_location(tree, location, width=DEFAULT_NODE_WIDTH, height=DEFAULT_NODE_HEIGHT):
+    """Return the free spot nearest to location for a width x height block and reserve it.
+
+    Call before creating the nodes, then record_node_locations() once they are placed.
+    """
+    prefs = get_preferences()
+    if prefs is not None and not prefs.avoid_overlaps:
+        return location
+    
+    index = get_spatial_index(tree)
+    step_x = width + PLACEMENT_MARGIN
+    step_y = height + PLACEMENT_MARGIN
+    for dx, dy in PLACEMENT_OFFSETS:
+        x = location[0] + dx * step_x
+        y = location[1] + dy * step_y
+        box = (x - PLACEMENT_MARGIN, y - height - PLACEMENT_MARGIN, x + width + PLACEMENT_MARGIN, y + PLACEMENT_MARGIN)
+        if index.is_free(box):
+            break
+    else:
+        x, y = location
+    index.insert((x, y - height, x + width, y))
+    return (x, y)
+
+def record_node_locations(tree, nodes):
+    """Keep the spatial index in sync with nodes QuickNodes just created and placed"""
+    index = _spatial_indexes.get(tree.as_pointer())
+    if index is not None:
+        for node in nodes:
+            index.locations.extend(node.location)
+
+@persistent
+def placement_load_post(*args):
+    # Tree pointers of the previous file may be reused
+    _spatial_indexes.clear()
+
+# AUTO-CONNECT
+# ============================================================================
+
+# Output socket type -> input socket types it can be linked to, the same type first
+SOCKET_COMPATIBILITY = {
+    'VALUE': ('VALUE', 'INT', 'BOOLEAN', 'VECTOR', 'RGBA'),
+    'INT': ('INT', 'VALUE', 'BOOLEAN', 'VECTOR', 'RGBA'),
+    'BOOLEAN': ('BOOLEAN', 'VALUE', 'INT', 'VECTOR', 'RGBA'),
+    'VECTOR': ('VECTOR', 'VALUE', 'INT', 'BOOLEAN', 'RGBA', 'ROTATION'),
+    'RGBA': ('RGBA', 'VALUE', 'INT', 'BOOLEAN', 'VECTOR'),
+    'ROTATION': ('ROTATION', 'VECTOR', 'MATRIX'),
+}
+
+# (tree type, node key) -> (input socket types, output socket types), None for unusable sockets
+_socket_signatures = {}
+# (tree type, from node key, to node key) -> ((output index, input index), ...) best first
+_connection_table = {}
+# (tree type, node key, input socket type) -> index of the first output that can feed it
+_output_table = {}
+
+# Node properties enabling or retyping sockets (Mix, Math, Switch, Compare, ...)
+SOCKET_SHAPING_PROPERTIES = ("data_type", "input_type", "mode", "operation", "factor_mode")
+
+# Nodes of one type share a signature only if their sockets are laid out alike:
+# group nodes get their sockets from the group they use, others from their
+# socket shaping properties, and nodes with item lists from their socket counts
+def node_key(node):
+    node_tree = getattr(node, "node_tree", None)
+    shape = tuple(getattr(node, name, None) for name in SOCKET_SHAPING_PROPERTIES)
+    return (node.bl_idname, node_tree.name if node_tree is not None else None,
+            shape, len(node.inputs), len(node.outputs))
+
+def socket_types(sockets):
+    return tuple(
+        socket.type if socket.enabled and socket.type != 'CUSTOM' else None
+        for socket in sockets)
+
+def get_socket_signature(tree, node):
+    """Return the cached socket types of node, read through RNA once per node key"""
+    key = (tree.bl_idname, node_key(node))
+    signature = _socket_signatures.get(key)
+    if signature is None:
+        signature = _socket_signatures[key] = (socket_types(node.inputs), socket_types(node.outputs))
+    return signature
+
+def match_sockets(outputs, inputs):
+    """Return the (output index, input index) pairs that can be linked, exact type matches first"""
+    exact = []
+    converted = []
+    for out_index, out_type in enumerate(outputs):
+        if out_type is None:
+            continue
+        compatible = SOCKET_COMPATIBILITY.get(out_type, (out_type,))
+        for in_index, in_type in enumerate(inputs):
+            if in_type is None or in_type not in compatible:
+                continue
+            (exact if in_type == out_type else converted).append((out_index, in_index))
+    return tuple(exact + converted)
+
+def usable_socket(sockets, index, socket_type):
+    """Return sockets[index] if it still matches its cached signature"""
+    if index >= len(sockets):
+        return None
+    socket = sockets[index]
+    if not socket.enabled or socket.type != socket_type:
+        return None
+    return socket
+
+def find_connection(tree, from_node, to_node):
+    """Return the best free (output, input) socket pair linking from_node to to_node, or None"""
+    outputs = get_socket_signature(tree, from_node)[1]
+    inputs = get_socket_signature(tree, to_node)[0]
+    key = (tree.bl_idname, node_key(from_node), node_key(to_node))
+    pairs = _connection_table.get(key)
+    if pairs is None:
+        pairs = _connection_table[key] = match_sockets(outputs, inputs)
+    
+    for out_index, in_index in pairs:
+        output = usable_socket(from_node.outputs, out_index, outputs[out_index])
+        input = usable_socket(to_node.inputs, in_index, inputs[in_index])
+        if output is None or input is None:
+            continue
+        if input.is_linked and not input.is_multi_input:
+            continue
+        return output, input
+    return None
+
+def find_output_for(tree, node, socket_type):
+    """Return the first output of node that can be linked to an input of socket_type, or None"""
+    outputs = get_socket_signature(tree, node)[1]
+    key = (tree.bl_idname, node_key(node), socket_type)
+    if key not in _output_table:
+        pairs = match_sockets(outputs, (socket_type,))
+        _output_table[key] = pairs[0][0] if pairs else None
+    out_index = _output_table[key]
+    if out_index is None:
+        return None
+    return usable_socket(node.outputs, out_index, outputs[out_index])
+
+def connect_new_nodes(context, tree, active, first, last):
+    """Wire freshly added nodes to the node that was active, following the connect mode.
+
+    first receives the active node's output. In INSERT mode the links leaving that
+    output are moved to come out of last instead. A zone passes its input and
+    output node so geometry is threaded through it; a single node passes itself twice.
+    """
+    props = getattr(context.scene, 'quick_nodes_props', None)
+    if props is None or props.connect_mode == 'NONE':
+        return
+    
+    # Thread the zone input straight through to its output
+    if first is not last:
+        pair = find_connection(tree, first, last)
+        if pair is not None:
+            tree.links.new(*pair)
+    
+    if active is None or active in (first, last):
+        return
+    pair = find_connection(tree, active, first)
+    if pair is None:
+        return
+    output, input = pair
+    downstream = [link.to_socket for link in output.links] if props.connect_mode == 'INSERT' else ()
+    tree.links.new(output, input)
+    
+    for to_socket in downstream:
+        new_output = find_output_for(tree, last, to_socket.type)
+        if new_output is None:
+            continue
+        for link in to_socket.links:
+            if link.from_socket == output:
+                tree.links.remove(link)
+                break
+        tree.links.new(new_output, to_socket)
+
+# UNDO STEPS
+# ============================================================================
+
+# The add operators push their undo step themselves rather than through the
+# UNDO option, so queueing into the basket doesn't cost a memfile step.
+# Blender can't merge undo steps and undoing loads the step before the active
+# one, so an add left unpushed would be undone together with the operation
+# before it. Every add is therefore pushed right away; a burst shares one step
+# only when it goes through the basket or a batch.
+def push_add_undo(count=1):
+    """Push the undo step of an add of count nodes"""
+    message = "Quick Nodes: Add Node" if count == 1 else f"Quick Nodes: Add {count} Nodes"
+    try:
+        bpy.ops.ed.undo_push(message=message)
+    except RuntimeError as error:
+        print(f"Quick Nodes: could not push undo step: {error}")
+
+# Add a node of node_type, using group if given, selected and placed left of the cursor
+def add_node_at_cursor(context, tree, node_type, group=None):
+    stage_tree(context, tree)
+    active = tree.nodes.active
+    
+    # Deselect all existing nodes
+    deselect_all_nodes(context)
+    
+    # Find free space near 800 units to the left of cursor location
+    cursor_loc = context.space_data.cursor_location
+    location = reserve_location(tree, (cursor_loc[0] - 800, cursor_loc[1]))
+    
+    # Create the node
+    node = tree.nodes.new(type=node_type)
+    node.location = location
+    if group is not None:
+        node.node_tree = group
+    record_node_locations(tree, (node,))
+    connect_new_nodes(context, tree, active, node, node)
+    
+    # Select the newly created node
+    node.select = True
+    tree.nodes.active = node
+    return node
+
+# Operator to add a node to the active node tree
+class QUICKNODES_OT_add_node(Operator):
+    bl_idname = "quicknodes.add_node"
+    bl_label = "Add Node"
+    bl_description = "Add a node to the active node tree"
+    bl_options = {'REGISTER'}
+    
+    node_type: StringProperty()
+    node_label: StringProperty()
+    group_name: StringProperty(
+        description="Node group used by the added group node"
+    )
+    
+    @profiled
+    def execute(self, context):
+        space = context.space_data
+        if space.type == 'NODE_EDITOR' and space.edit_tree:
+            # Basket items only know node types, groups are always added right away
+            if not self.group_name and queue_in_basket(context, self.node_type, self.node_label):
+                return {'FINISHED'}
+
+            if not NODE_AVAILABILITY.get(self.node_type, True):
+                self.report({'ERROR'}, f"{self.node_type} is not available in this Blender version")
+                return {'CANCELLED'}
+            
+            node_tree = space.edit_tree
+            group = None
+            if self.group_name:
+                group = bpy.data.node_groups.get(self.group_name)
+                if group is None:
+                    self.report({'ERROR'}, f"Node group {self.group_name} not found")
+                    return {'CANCELLED'}
+                if tree_uses_group(group, node_tree):
+                    self.report({'ERROR'}, f"Node group {self.group_name} can't be added inside itself")
+                    return {'CANCELLED'}
+            
+            add_node_at_cursor(context, node_tree, self.node_type, group)
+            if group is None:
+                record_usage(node_tree.bl_idname, self.node_type, self.node_label or self.node_type)
+            push_add_undo()
+            
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, "No active node tree found")
+            return {'CANCELLED'}
+
+# Operator to append or link a node group from an asset library and add it
+class QUICKNODES_OT_add_library_group(Operator):
+    bl_idname = "quicknodes.add_library_group"
+    bl_label = "Add Library Group"
+    bl_description = "Add a node group from an asset library, appending or linking it first"
+    bl_options = {'REGISTER'}
+    
+    filepath: StringProperty(subtype='FILE_PATH')
+    group_name: StringProperty()
+    
+    # Marks appended groups so the next add reuses them
+    SOURCE_PROPERTY = "quick_nodes_source"
+    
+    def find_loaded_group(self, link):
+        source = library_key(self.filepath, self.group_name)
+        for group in bpy.data.node_groups:
+            if link:
+                if (group.library is not None and group.name == self.group_name
+                        and os.path.normpath(bpy.path.abspath(group.library.filepath)) == os.path.normpath(self.filepath)):
+                    return group
+            elif group.library is None and group.get(self.SOURCE_PROPERTY) == source:
+                return group
+        return None
+    
+    def load_group(self, link):
+        try:
+            with bpy.data.libraries.load(self.filepath, link=link) as (data_from, data_to):
+                if self.group_name not in data_from.node_groups:
+                    return None
+                data_to.node_groups = [self.group_name]
+        except (OSError, RuntimeError) as error:
+            self.report({'ERROR'}, f"Could not load {self.filepath}: {error}")
+            return None
+        group = data_to.node_groups[0]
+        if group is not None and not link:
+            group[self.SOURCE_PROPERTY] = library_key(self.filepath, self.group_name)
+        return group
+    
+    @profiled
+    def execute(self, context):
+        space = context.space_data
+        if space.type != 'NODE_EDITOR' or not space.edit_tree:
+            self.report({'ERROR'}, "No active node tree found")
+            return {'CANCELLED'}
+        
+        tree = space.edit_tree
+        prefs = get_preferences()
+        link = prefs is not None and prefs.library_import == 'LINK'
+        group = self.find_loaded_group(link)
+        loaded = group is None
+        if loaded:
+            group = self.load_group(link)
+            if group is None:
+                self.report({'ERROR'}, f"Node group {self.group_name} not found in {self.filepath}")
+                return {'CANCELLED'}
+        
+        # The tree type is only known once the group is loaded
+        if ASSET_LIBRARY_INDEX.set_tree_type(self.filepath, self.group_name, group.bl_idname):
+            start_library_scan(rescan=False)
+        if group.bl_idname != tree.bl_idname or tree.bl_idname not in GROUP_NODE_TYPES:
+            if loaded and group.users == 0:
+                bpy.data.node_groups.remove(group)
+            self.report({'ERROR'}, f"{self.group_name} is not a {tree.bl_idname} group")
+            return {'CANCELLED'}
+        
+        add_node_at_cursor(context, tree, GROUP_NODE_TYPES[tree.bl_idname], group)
+        push_add_undo()
+        return {'FINISHED'}
+
+# Operator to index the asset libraries again
+class QUICKNODES_OT_rescan_libraries(Operator):
+    bl_idname = "quicknodes.rescan_libraries"
+    bl_label = "Rescan Asset Libraries"
+    bl_description = "Look for node groups in changed files of the asset libraries"
+    
+    @profiled
+    def execute(self, context):
+        # The cached index has to be loaded before scanning on top of it
+        run_warmup_task("libraries")
+        start_library_scan()
+        return {'FINISHED'}
+
+# DEFINE FUNCTIONS FOR NODE PAIRS
+# ============================================================================
+
+# Create a paired zone with the input node at location and the output 200 units to its right
+def add_zone_nodes(tree, input_type, output_type, location):
+    node_input = tree.nodes.new(input_type)
+    node_output = tree.nodes.new(output_type)
+    
+    # Position the nodes horizontally (input on left, output on right)
+    node_input.location = (location[0], location[1])
+    node_output.location = (location[0] + 200, location[1])
+    
+    # Pair the nodes
+    node_input.pair_with_output(node_output)
+    return node_input, node_output
+
+# Base class for the operators adding a zone input/output pair
+class QuickNodesZoneOperator:
+    bl_options = {'REGISTER'}
+    zone_input = ""
+    zone_output = ""
+    
+    @profiled
+    def execute(self, context):
+        space = context.space_data
+        if space.type == 'NODE_EDITOR' and space.edit_tree:
+            if queue_in_basket(context, type(self).__name__, self.bl_label):
+                return {'FINISHED'}
+
+            tree = space.edit_tree
+            cursor_loc = space.cursor_location
+            stage_tree(context, tree)
+            active = tree.nodes.active
+            
+            # Deselect all existing nodes
+            deselect_all_nodes(context)
+            
+            # Create the zone nodes in free space near 900 units left of the cursor
+            location = reserve_location(tree, (cursor_loc[0] - 900, cursor_loc[1]), ZONE_WIDTH)
+            node_input, node_output = add_zone_nodes(
+                tree, self.zone_input, self.zone_output, location)
+            record_node_locations(tree, (node_input, node_output))
+            connect_new_nodes(context, tree, active, node_input, node_output)
+            record_usage(tree.bl_idname, type(self).__name__, self.bl_label)
+            
+            # Select both nodes in the pair for easy movement
+            node_input.select = True
+            node_output.select = True
+            tree.nodes.active = node_input
+            push_add_undo()
+            
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, "No active node tree found")
+            return {'CANCELLED'}
+
+class QUICKNODES_OT_add_simulation_zone(QuickNodesZoneOperator, Operator):
+    bl_idname = "quicknodes.add_simulation_zone"
+    bl_label = "Simulation Zone"
+    zone_input = "GeometryNodeSimulationInput"
+    zone_output = "GeometryNodeSimulationOutput"
+
+
+class QUICKNODES_OT_add_foreach_element_zone(QuickNodesZoneOperator, Operator):
+    bl_idname = "quicknodes.add_foreach_element_zone"
+    bl_label = "For Each Element"
+    zone_input = "GeometryNodeForeachGeometryElementInput"
+    zone_output = "GeometryNodeForeachGeometryElementOutput"
+    
+    
+class QUICKNODES_OT_add_repeat_zone(QuickNodesZoneOperator, Operator):
+    bl_idname = "quicknodes.add_repeat_zone"
+    bl_label = "Repeat"
+    zone_input = "GeometryNodeRepeatInput"
+    zone_output = "GeometryNodeRepeatOutput"
+            
+class QUICKNODES_OT_add_closure_zone(QuickNodesZoneOperator, Operator):
+    bl_idname = "quicknodes.add_closure_zone"
+    bl_label = "Closure"
+    zone_input = "NodeClosureInput"
+    zone_output = "NodeClosureOutput"
+
+# Zone operator class names as they appear in the catalog
+ZONE_OPERATORS = {
+    cls.__name__: cls
+    for cls in (
+        QUICKNODES_OT_add_simulation_zone,
+        QUICKNODES_OT_add_foreach_element_zone,
+        QUICKNODES_OT_add_repeat_zone,
+        QUICKNODES_OT_add_closure_zone,
+    )
+}
+
+# BATCH ADD
+# ============================================================================
+
+# Vertical distance between nodes added in one batch
+BATCH_ROW_SPACING = 250
+
+class QUICKNODES_OT_add_batch(Operator):
+    bl_idname = "quicknodes.add_batch"
+    bl_label = "Add Basket"
+    bl_description = "Add all queued nodes in a column with a single undo step"
+    bl_options = {'REGISTER'}
+    
+    node_types: StringProperty(
+        description="Comma separated node types to add, the basket is used when empty"
+    )
+    
+    @profiled
+    def execute(self, context):
+        space = context.space_data
+        if space.type != 'NODE_EDITOR' or not space.edit_tree:
+            self.report({'ERROR'}, "No active node tree found")
+            return {'CANCELLED'}
+        
+        props = context.scene.quick_nodes_props
+        if self.node_types:
+            entries = [(t.strip(), t.strip()) for t in self.node_types.split(",") if t.strip()]
+        else:
+            entries = [(item.node_type, item.label or item.node_type) for item in props.basket]
+        if not entries:
+            self.report({'INFO'}, "Basket is empty")
+            return {'CANCELLED'}
+        
+        tree = space.edit_tree
+        cursor_loc = space.cursor_location
+        stage_tree(context, tree)
+        
+        # Deselect once for the whole batch
+        deselect_all_nodes(context)
+        
+        # Lay the nodes out in a column starting 800 units left of the cursor
+        x = cursor_loc[0] - 800
+        y = cursor_loc[1]
+        added = []
+        failed = []
+        for node_type, label in entries:
+            try:
+                zone = ZONE_OPERATORS.get(node_type)
+                if zone is not None:
+                    location = reserve_location(tree, (x - 100, y), ZONE_WIDTH)
+                    nodes = add_zone_nodes(tree, zone.zone_input, zone.zone_output, location)
+                else:
+                    location = reserve_location(tree, (x, y))
+                    node = tree.nodes.new(type=node_type)
+                    node.location = location
+                    nodes = (node,)
+            except RuntimeError:
+                failed.append(node_type)
+                continue
+            record_node_locations(tree, nodes)
+            added.extend(nodes)
+            # Each queued entry counts as one add, like adding it directly
+            record_usage(tree.bl_idname, node_type, label)
+            y = location[1] - BATCH_ROW_SPACING
+        
+        for node in added:
+            node.select = True
+        if added:
+            tree.nodes.active = added[-1]
+            # The whole batch is one add
+            push_add_undo(len(added))
+        
+        if not self.node_types:
+            props.basket.clear()
+        if failed:
+            self.report({'WARNING'}, f"Could not add: {', '.join(failed)}")
+        return {'FINISHED'} if added else {'CANCELLED'}
+
+class QUICKNODES_OT_basket_remove(Operator):
+    bl_idname = "quicknodes.basket_remove"
+    bl_label = "Remove from Basket"
+    bl_description = "Remove a node from the basket"
+    
+    index: IntProperty()
+    
+    @profiled
+    def execute(self, context):
+        basket = context.scene.quick_nodes_props.basket
+        if 0 <= self.index < len(basket):
+            basket.remove(self.index)
+        return {'FINISHED'}
+
+class QUICKNODES_OT_basket_clear(Operator):
+    bl_idname = "quicknodes.basket_clear"
+    bl_label = "Clear Basket"
+    bl_description = "Remove all nodes from the basket"
+    
+    @profiled
+    def execute(self, context):
+        context.scene.quick_nodes_props.basket.clear()
+        return {'FINISHED'}
+
+# FAVORITE OPERATORS
+# ============================================================================
+
+# Base class for the operators editing the favorites of the edited tree type
+class QuickNodesFavoriteOperator:
+    node_type: StringProperty(
+        description="Catalog entry to change, the active node when empty"
+    )
+    
+    @classmethod
+    def poll(cls, context):
+        space = context.space_data
+        return space is not None and space.type == 'NODE_EDITOR' and space.edit_tree is not None
+    
+    def get_node_type(self, context):
+        if self.node_type:
+            return self.node_type
+        active = context.space_data.edit_tree.nodes.active
+        return catalog_entry_for_node(active) if active is not None else ""
+    
+    def save(self, tree_type, node_types):
+        try:
+            FAVORITES.set(tree_type, node_types)
+        except OSError as error:
+            self.report({'ERROR'}, f"Could not save favorites: {error}")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+class QUICKNODES_OT_favorite_add(QuickNodesFavoriteOperator, Operator):
+    bl_idname = "quicknodes.favorite_add"
+    bl_label = "Add Favorite"
+    bl_description = "Add the active node to the Quick Nodes favorites"
+    
+    @profiled
+    def execute(self, context):
+        tree_type = context.space_data.edit_tree.bl_idname
+        node_type = self.get_node_type(context)
+        if get_catalog_view(tree_type).find(node_type) is None:
+            self.report({'ERROR'}, "The active node is not in the Quick Nodes catalog")
+            return {'CANCELLED'}
+        if FAVORITES.contains(tree_type, node_type):
+            return {'FINISHED'}
+        return self.save(tree_type, FAVORITES.entries.get(tree_type, []) + [node_type])
+
+class QUICKNODES_OT_favorite_remove(QuickNodesFavoriteOperator, Operator):
+    bl_idname = "quicknodes.favorite_remove"
+    bl_label = "Remove Favorite"
+    bl_description = "Remove the active node from the Quick Nodes favorites"
+    
+    @profiled
+    def execute(self, context):
+        tree_type = context.space_data.edit_tree.bl_idname
+        node_type = self.get_node_type(context)
+        if not FAVORITES.contains(tree_type, node_type):
+            self.report({'ERROR'}, "The active node is not a favorite")
+            return {'CANCELLED'}
+        return self.save(tree_type, [entry for entry in FAVORITES.entries[tree_type] if entry != node_type])
+
+# Operator to switch to another page of search results
+class QUICKNODES_OT_search_page(Operator):
+    bl_idname = "quicknodes.search_page"
+    bl_label = "Search Page"
+    bl_description = "Show another page of search results"
+    
+    page: IntProperty(min=0)
+    
+    @profiled
+    def execute(self, context):
+        state = get_search_state(context)
+        if state is None:
+            return {'CANCELLED'}
+        state.search_page = self.page
+        return {'FINISHED'}
+
+# Function to draw nodes in a 2-column layout
+def draw_nodes_two_column(layout, nodes):
+    col = layout.column(align=True)
+    row = col.row()
+    
+    # Create two columns
+    col1 = row.column()
+    col2 = row.column()
+    
+    # Distribute nodes between the two columns, node groups come as (node_type, label, group name)
+    for i, node in enumerate(nodes):
+        node_type, node_name = node[0], node[1]
+        col = col1 if i % 2 == 0 else col2
+        
+        # Grey out entries the running Blender can't create
+        if not NODE_AVAILABILITY.get(node_type, True):
+            col = col.row()
+            col.enabled = False
+        
+        # Check if this is a custom operator or a regular node
         if node_type.startswith("QUICKNODES_OT_"):
             # Create operator button for custom operators
             op = col.operator(node_type, text=node_name)
@@ -736,18 +3136,52 @@ def draw_nodes_two_column(layout, nodes):
             # Create operator button for regular nodes
             op = col.operator("quicknodes.add_node", text=node_name)
             op.node_type = node_type
+            op.node_label = node_name
+            if len(node) > 2:
+                op.group_name = node[2]
 
 # Base panel class for all Quick Nodes panels
 class QuickNodesPanel:
+    """Shown only while a node tree is edited, and only if poll_tree_type() allows it.
+
+    The decision is cached per panel and tree type, so Blender skips panels
+    without content before any layout is done and polling stays a dict lookup.
+    poll_tree_type() returns None when it can't decide without building a
+    cache, the panel is then shown without caching the answer.
+    """
     bl_space_type = 'NODE_EDITOR'
     bl_region_type = 'UI'
     bl_category = "Quick Nodes"
+    
+    @classmethod
+    def poll(cls, context):
+        tree_type = get_edit_tree_type(context)
+        if not tree_type:
+            return False
+        key = (cls.bl_idname, tree_type)
+        visible = _panel_visibility.get(key)
+        if visible is None:
+            visible = cls.poll_tree_type(tree_type)
+            if visible is None:
+                return True
+            _panel_visibility[key] = visible
+        return visible
+    
+    @classmethod
+    def poll_tree_type(cls, tree_type):
+        return True
 
 # Main panel
 class NODE_PT_quick_nodes_main(QuickNodesPanel, Panel):
     bl_label = "Quick Nodes"
     bl_idname = "NODE_PT_quick_nodes_main"
     
+    # Also shown without a node tree, to explain how to get one
+    @classmethod
+    def poll(cls, context):
+        return True
+    
+    @profiled
     def draw(self, context):
         layout = self.layout
         
@@ -761,27 +3195,65 @@ class NODE_PT_quick_nodes_main(QuickNodesPanel, Panel):
             col.label(text="To use Quick Nodes:")
             col.label(text="Create or open a Geometry Nodes setup")
             return
+        
+        if not hasattr(context.scene, 'quick_nodes_props'):
+            return
+        props = context.scene.quick_nodes_props
+        
+        # Warm-up progress, until every cache is built
+        done, total = get_warmup_progress()
+        if done < total:
+            box = layout.box()
+            box.label(text=f"Preparing Quick Nodes {done}/{total}", icon='SORTTIME')
+            col = box.column(align=True)
+            for task in _warmup_tasks.values():
+                if task.duration is not None:
+                    col.label(text=f"{task.label}: {task.duration:.1f} ms", icon='CHECKMARK')
+        
+        # Staging: modifiers using the edited trees are suspended until it ends
+        layout.prop(props, "staging_mode", icon='PAUSE')
+        if props.staging_mode:
+            layout.label(
+                text=f"{len(props.staged_trees)} trees, {len(props.staged_modifiers)} modifiers suspended",
+                icon='INFO')
+        
+        # Auto-connect: link new nodes to the active one
+        layout.prop(props, "connect_mode", expand=True)
+        
+        # Basket: taps queue nodes, one click adds them all
+        layout.prop(props, "basket_mode", icon='PACKAGE')
+        if props.basket:
+            box = layout.box()
+            col = box.column(align=True)
+            for i, item in enumerate(props.basket):
+                row = col.row(align=True)
+                row.label(text=item.label)
+                row.operator("quicknodes.basket_remove", text="", icon='X').index = i
+            row = box.row(align=True)
+            row.operator("quicknodes.add_batch", text=f"Add {len(props.basket)} Nodes", icon='ADD')
+            row.operator("quicknodes.basket_clear", text="", icon='TRASH')
 
 # Search panel
 class NODE_PT_quick_nodes_search(QuickNodesPanel, Panel):
     bl_label = "SEARCH"
     bl_idname = "NODE_PT_quick_nodes_search"
     bl_parent_id = "NODE_PT_quick_nodes_main"
+    
+    @classmethod
+    def poll_tree_type(cls, tree_type):
+        return tree_type in TREE_CATALOG_OVERRIDES
         
+    @profiled
     def draw(self, context):
         layout = self.layout
-        
-        # Check if there's an active node tree
         space = context.space_data
-        if space.type != 'NODE_EDITOR' or not space.edit_tree:
-            # Don't show search if no active node tree
-            return
             
-        # Check if the property exists, if not create it
-        if not hasattr(context.scene, 'quick_nodes_props'):
+        # Every Node Editor searches on its own
+        props = get_search_state(context)
+        if props is None:
+            request_search_state(context)
+            layout.label(text="Preparing search...", icon='VIEWZOOM')
             return
-            
-        props = context.scene.quick_nodes_props
         
         # Search box
         layout.prop(props, "search_filter", text="", icon='VIEWZOOM')
@@ -789,19 +3261,38 @@ class NODE_PT_quick_nodes_search(QuickNodesPanel, Panel):
         # Show search results if there's a search term
         if props.search_filter:
             layout.separator()
-            search_term = props.search_filter.lower()
-            
-            # Filter nodes based on search term
-            results = [node for node in ALL_NODES if search_term in node[1].lower()]
+            # Results are computed by the search_filter update callback
+            tree_type = space.edit_tree.bl_idname
+            total, results = get_search_results(props.search_filter, tree_type, props.search_page)
+            pages = max(1, -(-total // SEARCH_PAGE_SIZE))
+            page = props.search_page
+            if page >= pages:
+                # The query matches fewer results than when the page was picked
+                page = pages - 1
+                total, results = get_search_results(props.search_filter, tree_type, page)
             
             if results:
                 box = layout.box()
-                box.label(text=f"Results ({len(results)}):", icon='ZOOM_IN')
-                draw_nodes_two_column(box, results[:30])  # Limit to 30 results
-                if len(results) > 30:
-                    box.label(text=f"...and {len(results) - 30} more")
+                box.label(text=f"Results ({total}):", icon='ZOOM_IN')
+                draw_nodes_two_column(box, results)  # One page of SEARCH_PAGE_SIZE results
+                if pages > 1:
+                    row = box.row(align=True)
+                    prev = row.row(align=True)
+                    prev.enabled = page > 0
+                    prev.operator("quicknodes.search_page", text="", icon='TRIA_LEFT').page = page - 1
+                    row.label(text=f"Page {page + 1} / {pages}")
+                    next = row.row(align=True)
+                    next.enabled = page < pages - 1
+                    next.operator("quicknodes.search_page", text="", icon='TRIA_RIGHT').page = page + 1
             else:
                 layout.label(text="No results found", icon='INFO')
+            
+            # Node groups of the asset libraries
+            library_total, library_results = get_library_search_results(props.search_filter, tree_type)
+            if library_results:
+                box = layout.box()
+                box.label(text=f"Library ({library_total}):", icon='ASSET_MANAGER')
+                draw_library_groups(box, library_results)
 
 # Quick Favorites panel
 class NODE_PT_quick_nodes_favorites(QuickNodesPanel, Panel):
@@ -810,66 +3301,299 @@ class NODE_PT_quick_nodes_favorites(QuickNodesPanel, Panel):
     bl_parent_id = "NODE_PT_quick_nodes_main"
     bl_options = {'DEFAULT_CLOSED'}
     
+    @classmethod
+    def poll_tree_type(cls, tree_type):
+        return tree_type in TREE_CATALOG_OVERRIDES
+    
+    @profiled
     def draw(self, context):
         layout = self.layout
+        tree = context.space_data.edit_tree
+        favorites = FAVORITES.get(tree.bl_idname)
+        if favorites:
+            draw_nodes_two_column(layout, favorites)
+        else:
+            col = layout.column(align=True)
+            col.label(text="No favorites set", icon='SOLO_OFF')
+            col.label(text="Select a node and add it below")
         
-        # Check if there's an active node tree
+        # Edit the favorites through the active node
+        active = tree.nodes.active
+        if active is not None:
+            row = layout.row(align=True)
+            if FAVORITES.contains(tree.bl_idname, catalog_entry_for_node(active)):
+                row.operator("quicknodes.favorite_remove", text="Remove Active", icon='SOLO_OFF')
+            else:
+                row.operator("quicknodes.favorite_add", text="Add Active", icon='SOLO_ON')
+
+# Node groups of the edited tree type
+class NODE_PT_quick_nodes_groups(QuickNodesPanel, Panel):
+    bl_label = "GROUPS"
+    bl_idname = "NODE_PT_quick_nodes_groups"
+    bl_parent_id = "NODE_PT_quick_nodes_main"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    @classmethod
+    def poll_tree_type(cls, tree_type):
+        return tree_type in GROUP_NODE_TYPES
+    
+    @profiled
+    def draw(self, context):
+        layout = self.layout
+        tree = context.space_data.edit_tree
+        # A group can't be added inside itself
+        groups = [entry for entry in get_node_group_entries(tree.bl_idname) if entry[2] != tree.name]
+        if groups:
+            draw_nodes_two_column(layout, groups)
+        else:
+            layout.label(text="No node groups", icon='NODETREE')
+
+# Node groups of the asset libraries
+class NODE_PT_quick_nodes_library(QuickNodesPanel, Panel):
+    bl_label = "LIBRARY"
+    bl_idname = "NODE_PT_quick_nodes_library"
+    bl_parent_id = "NODE_PT_quick_nodes_main"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    # Library groups are added through a group node
+    @classmethod
+    def poll_tree_type(cls, tree_type):
+        return tree_type in GROUP_NODE_TYPES
+    
+    @profiled
+    def draw(self, context):
+        layout = self.layout
         space = context.space_data
-        if space.type != 'NODE_EDITOR' or not space.edit_tree:
-            # Don't show favorites if no active node tree
+        
+        row = layout.row(align=True)
+        if _library_scan is not None:
+            row.label(text=f"Indexing, {ASSET_LIBRARY_INDEX.scanned} files checked", icon='SORTTIME')
+        else:
+            row.label(text=f"{len(ASSET_LIBRARY_INDEX.files)} library files")
+        row.operator("quicknodes.rescan_libraries", text="", icon='FILE_REFRESH')
+        
+        entries = ASSET_LIBRARY_INDEX.entries(space.edit_tree.bl_idname)
+        if entries:
+            draw_library_groups(layout, entries)
+        else:
+            layout.label(text="No node groups in the asset libraries", icon='ASSET_MANAGER')
+
+# Recently and frequently added nodes of the edited tree type
+class NODE_PT_quick_nodes_recent(QuickNodesPanel, Panel):
+    bl_label = "RECENT"
+    bl_idname = "NODE_PT_quick_nodes_recent"
+    bl_parent_id = "NODE_PT_quick_nodes_main"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    @classmethod
+    def poll_tree_type(cls, tree_type):
+        return tree_type in TREE_CATALOG_OVERRIDES
+    
+    @profiled
+    def draw(self, context):
+        layout = self.layout
+        recent, frequent, _ = USAGE_STATS.view(context.space_data.edit_tree.bl_idname)
+        if not recent:
+            layout.label(text="No nodes added yet", icon='TIME')
             return
         
-        # Get favorites from Blender's workspace tools
-        favorites = []
+        layout.label(text="Recent", icon='TIME')
+        draw_nodes_two_column(layout, recent)
+        layout.label(text="Frequent", icon='SORTTIME')
+        draw_nodes_two_column(layout, frequent)
+
+# Profiling debug panel
+class NODE_PT_quick_nodes_debug(QuickNodesPanel, Panel):
+    bl_label = "DEBUG"
+    bl_idname = "NODE_PT_quick_nodes_debug"
+    bl_parent_id = "NODE_PT_quick_nodes_main"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    @classmethod
+    def poll(cls, context):
+        return _profiling_enabled
+    
+    def draw(self, context):
+        layout = self.layout
+        stats = get_profile_stats()
+        if not stats:
+            layout.label(text="No timings recorded yet", icon='INFO')
+        else:
+            col = layout.column(align=True)
+            row = col.row()
+            row.label(text="Name")
+            row.label(text="p50 / p95 / max ms")
+            for name, calls, p50, p95, peak in stats:
+                row = col.row()
+                row.label(text=f"{name.replace('NODE_PT_quick_nodes_', '')} ({calls})")
+                row.label(text=f"{p50:.2f} / {p95:.2f} / {peak:.2f}")
         
+        # Warm-up timings stay here once the main panel stops showing them
+        if _warmup_tasks:
+            col = layout.column(align=True)
+            col.label(text="Warm-up")
+            for task in _warmup_tasks.values():
+                row = col.row()
+                row.label(text=task.label)
+                row.label(text="pending" if task.duration is None else f"{task.duration:.2f}")
+        row = layout.row(align=True)
+        row.operator("quicknodes.export_timings", icon='EXPORT')
+        row.operator("quicknodes.reset_timings", text="", icon='TRASH')
+
+class QUICKNODES_OT_export_timings(Operator):
+    bl_idname = "quicknodes.export_timings"
+    bl_label = "Export Timings"
+    bl_description = "Write the recorded timings to a .csv or .json file"
+    
+    filepath: StringProperty(subtype='FILE_PATH')
+    filter_glob: StringProperty(default="*.csv;*.json", options={'HIDDEN'})
+    
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "quick_nodes_timings.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    @profiled
+    def execute(self, context):
         try:
-            # Access the node editor's favorites
-            wm = context.window_manager
-            if hasattr(wm, 'operators'):
-                # Check for node add search favorites
-                for item in wm.operators:
-                    if hasattr(item, 'name'):
-                        pass
-            
-            # Try to get from workspace tool settings
-            workspace = context.workspace
-            if workspace:
-                # Blender stores favorites in the workspace
-                pass
-                
-        except Exception as e:
-            pass
+            export_profile(bpy.path.abspath(self.filepath))
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write timings: {e}")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+class QUICKNODES_OT_reset_timings(Operator):
+    bl_idname = "quicknodes.reset_timings"
+    bl_label = "Reset Timings"
+    bl_description = "Forget all recorded timings"
+    
+    @profiled
+    def execute(self, context):
+        _profile_timings.clear()
+        return {'FINISHED'}
+
+# Function to build the class name of a category or subcategory panel
+def category_panel_name(*names):
+    return "NODE_PT_quick_nodes_" + "_".join(name.lower().replace(' ', '_') for name in names)
+
+# Function to collect the panels needed by the catalogs of every tree type
+def get_panel_layout():
+    """Return {category: [subcategory names]} over every tree type, in catalog order.
+
+    Built from the overrides and every generated family so panels can be
+    registered before the catalog views, they poll for content anyway.
+    """
+    panel_layout = {}
+    for tree_type, overrides in TREE_CATALOG_OVERRIDES.items():
+        families = {family: [] for family in GENERATED_FAMILIES[tree_type].values()}
+        for category_name, content in list(overrides.items()) + [(GENERATED_CATEGORY, families)]:
+            subcategories = panel_layout.setdefault(category_name, [])
+            if isinstance(content, dict):
+                for subcategory_name in content:
+                    # "Main Nodes" are drawn in the category panel itself
+                    if subcategory_name != "Main Nodes" and subcategory_name not in subcategories:
+                        subcategories.append(subcategory_name)
+    return panel_layout
+
+# Function to look up what a category panel shows in the edited tree's catalog
+def get_category_content(context, category_name, subcategory_name=None):
+    """Return the content of a category or subcategory for the edited tree, or None"""
+    tree_type = get_edit_tree_type(context)
+    if not tree_type:
+        return None
+    return get_tree_category_content(tree_type, category_name, subcategory_name)
+
+# Function deciding whether a category panel polls visible for a tree type
+def poll_tree_category(tree_type, category_name, subcategory_name=None):
+    """Return whether the category has content in tree_type's catalog, None while the view isn't built.
+
+    Polling must not build the catalog, that is left to the warm-up. Until
+    then the overrides tell which categories can't have content at all.
+    """
+    if tree_type in CATALOG_VIEWS:
+        return bool(get_tree_category_content(tree_type, category_name, subcategory_name))
+    overrides = TREE_CATALOG_OVERRIDES.get(tree_type)
+    if overrides is None:
+        return False
+    if category_name == GENERATED_CATEGORY:
+        if subcategory_name is not None and subcategory_name not in GENERATED_FAMILIES[tree_type].values():
+            return False
+        return None
+    content = overrides.get(category_name)
+    if not content:
+        return False
+    if subcategory_name is not None and not (isinstance(content, dict) and content.get(subcategory_name)):
+        return False
+    return None
+
+def get_tree_category_content(tree_type, category_name, subcategory_name=None):
+    """Return the content of a category or subcategory in the catalog of tree_type, or None"""
+    content = get_catalog_view(tree_type).categories.get(category_name)
+    if subcategory_name is None:
+        return content
+    return content.get(subcategory_name) if isinstance(content, dict) else None
+
+# Function to create the subcategory panels of one category
+def create_subcategory_panels(category_name, subcategory_names):
+    panels = []
+    class_name = category_panel_name(category_name)
+    
+    for subcategory_name in subcategory_names:
+        sub_class_name = category_panel_name(category_name, subcategory_name)
         
-        # If we can't find favorites, show a helpful message
-        if not favorites:
-            col = layout.column(align=True)
-            col.label(text="No favorites set", icon='SOLO_OFF')
-            col.separator()
-            col.label(text="To add favorites:", icon='INFO')
-            col.label(text="1. Press Shift+A in node editor")
-            col.label(text="2. Right-click on any node")
-            col.label(text="3. Select 'Add to Quick Favorites'")
-        else:
-            draw_nodes_two_column(layout, favorites)
+        # Create closures to capture the subcategory, its nodes are looked up
+        # in the edited tree's catalog so one panel serves every tree type
+        def make_sub_poll_method(name, sub_name):
+            def poll_tree_type(cls, tree_type):
+                return poll_tree_category(tree_type, name, sub_name)
+            return classmethod(poll_tree_type)
+        
+        def make_sub_draw_method(name, sub_name):
+            def draw(self, context):
+                draw_nodes_two_column(self.layout, get_category_content(context, name, sub_name) or ())
+            return profiled(draw)
+        
+        sub_panel_class = type(
+            sub_class_name,
+            (QuickNodesPanel, Panel),
+            {
+                "bl_label": subcategory_name,
+                "bl_idname": sub_class_name,
+                "bl_parent_id": class_name,
+                "bl_options": {'DEFAULT_CLOSED'},
+                "poll_tree_type": make_sub_poll_method(category_name, subcategory_name),
+                "draw": make_sub_draw_method(category_name, subcategory_name)
+            }
+        )
+        panels.append(sub_panel_class)
+    
+    return panels
 
 # Function to create category panels dynamically
-def create_category_panels():
+def create_category_panels(subcategories=True):
+    """Create the category panels, with their subcategory panels unless subcategories is False"""
     panels = []
     
-    for category_name, category_content in NODE_CATEGORIES.items():
+    for category_name, subcategory_names in get_panel_layout().items():
         # Create main category panel
-        class_name = f"NODE_PT_quick_nodes_{category_name.lower().replace(' ', '_')}"
+        class_name = category_panel_name(category_name)
         
-        # Create a closure to capture the category content
-        def make_draw_method(content):
+        # Create closures to capture the category, its content is looked up
+        # in the edited tree's catalog so one panel serves every tree type
+        def make_poll_method(name):
+            def poll_tree_type(cls, tree_type):
+                return poll_tree_category(tree_type, name)
+            return classmethod(poll_tree_type)
+        
+        def make_draw_method(name):
             def draw(self, context):
-                # Check if there's an active node tree
-                space = context.space_data
-                if space.type != 'NODE_EDITOR' or not space.edit_tree:
-                    # Don't show nodes if no active node tree
-                    return
-                    
+                content = get_category_content(context, name) or ()
                 if isinstance(content, dict):
+                    # The panel is expanded, make sure its subcategories exist
+                    if name in _pending_subcategories:
+                        request_subcategory_panels(name)
+                    
                     # Draw main nodes first if they exist
                     if "Main Nodes" in content:
                         main_nodes = content["Main Nodes"]
@@ -879,7 +3603,7 @@ def create_category_panels():
                 else:
                     # This is a simple list of nodes
                     draw_nodes_two_column(self.layout, content)
-            return draw
+            return profiled(draw)
         
         panel_class = type(
             class_name,
@@ -889,83 +3613,249 @@ def create_category_panels():
                 "bl_idname": class_name,
                 "bl_parent_id": "NODE_PT_quick_nodes_main",
                 "bl_options": {'DEFAULT_CLOSED'},
-                "draw": make_draw_method(category_content)
+                "poll_tree_type": make_poll_method(category_name),
+                "draw": make_draw_method(category_name)
             }
         )
         panels.append(panel_class)
         
         # If category has subcategories, create subcategory panels
-        if isinstance(category_content, dict):
-            for subcategory_name, nodes in category_content.items():
-                # Skip "Main Nodes" as they're already displayed in the main panel
-                if subcategory_name == "Main Nodes":
-                    continue
-                    
-                sub_class_name = f"NODE_PT_quick_nodes_{category_name.lower().replace(' ', '_')}_{subcategory_name.lower().replace(' ', '_')}"
-                
-                # Create a closure to capture the nodes
-                def make_sub_draw_method(node_list):
-                    def draw(self, context):
-                        # Check if there's an active node tree
-                        space = context.space_data
-                        if space.type != 'NODE_EDITOR' or not space.edit_tree:
-                            # Don't show nodes if no active node tree
-                            return
-                            
-                        draw_nodes_two_column(self.layout, node_list)
-                    return draw
-                
-                sub_panel_class = type(
-                    sub_class_name,
-                    (QuickNodesPanel, Panel),
-                    {
-                        "bl_label": subcategory_name,
-                        "bl_idname": sub_class_name,
-                        "bl_parent_id": class_name,
-                        "bl_options": {'DEFAULT_CLOSED'},
-                        "draw": make_sub_draw_method(nodes)
-                    }
-                )
-                panels.append(sub_panel_class)
+        if subcategories and subcategory_names:
+            panels.extend(create_subcategory_panels(category_name, subcategory_names))
     
     return panels
 
-# Create all category panels
-category_panels = create_category_panels()
+# LAZY PANEL REGISTRATION
+# ============================================================================
+
+# Category panels registered so far, unregistered in reverse order
+_registered_panels = []
+# Categories whose subcategory panels have not been registered yet
+_pending_subcategories = set()
+
+def register_panel(cls):
+    bpy.utils.register_class(cls)
+    _registered_panels.append(cls)
+
+def register_subcategory_panels(category_name):
+    """Register the subcategory panels of category_name if they are still pending"""
+    if category_name not in _pending_subcategories:
+        return
+    _pending_subcategories.discard(category_name)
+    for cls in create_subcategory_panels(category_name, get_panel_layout().get(category_name, ())):
+        register_panel(cls)
+    tag_node_editor_redraw()
+
+def request_subcategory_panels(category_name):
+    # Panels can't be registered while drawing, defer to a timer
+    bpy.app.timers.register(lambda: register_subcategory_panels(category_name), first_interval=0.0)
+
+def register_all_subcategory_panels():
+    for category_name in list(_pending_subcategories):
+        register_subcategory_panels(category_name)
+
+def tag_node_editor_redraw():
+    """Redraw every Node Editor so newly registered panels show up"""
+    wm = bpy.context.window_manager
+    if wm is None:
+        return
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == 'NODE_EDITOR':
+                area.tag_redraw()
+
+def update_lazy_panels(self, context):
+    # Switching lazy registration off registers everything still pending
+    if not self.lazy_panels:
+        register_all_subcategory_panels()
+
+# Add-on preferences
+class QuickNodesPreferences(AddonPreferences):
+    bl_idname = __name__
+    
+    lazy_panels: BoolProperty(
+        name="Lazy Subcategory Panels",
+        description="Register subcategory panels only when their category is first expanded",
+        default=True,
+        update=update_lazy_panels
+    )
+    
+    unavailable_nodes: EnumProperty(
+        name="Unavailable Nodes",
+        description="How to show catalog entries that don't exist in this Blender",
+        items=(
+            ('HIDE', "Hide", "Leave unavailable nodes out of the panels and search"),
+            ('DISABLE', "Grey Out", "Show unavailable nodes as disabled buttons"),
+        ),
+        default='HIDE',
+        update=lambda self, context: load_node_catalog()
+    )
+    
+    avoid_overlaps: BoolProperty(
+        name="Avoid Overlapping Nodes",
+        description="Place new nodes in the nearest free space instead of on top of existing ones",
+        default=True
+    )
+    
+    index_libraries: BoolProperty(
+        name="Index Asset Libraries",
+        description="Look for node groups in the asset library folders in the background after startup",
+        default=True
+    )
+    
+    library_import: EnumProperty(
+        name="Library Groups",
+        description="How node groups from the asset libraries are brought into the file",
+        items=(
+            ('APPEND', "Append", "Copy the group into the file, reusing an earlier copy"),
+            ('LINK', "Link", "Link the group from its library file"),
+        ),
+        default='APPEND'
+    )
+    
+    enable_profiling: BoolProperty(
+        name="Profile Panels and Operators",
+        description="Record draw and execute timings, shown in the Quick Nodes Debug panel",
+        default=False,
+        update=lambda self, context: set_profiling(self.enable_profiling)
+    )
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "lazy_panels")
+        layout.prop(self, "unavailable_nodes")
+        layout.prop(self, "avoid_overlaps")
+        layout.prop(self, "index_libraries")
+        layout.prop(self, "library_import")
+        layout.prop(self, "enable_profiling")
+        unresolved = get_unresolved_node_types()
+        if unresolved:
+            row = layout.row()
+            row.label(text=f"{len(unresolved)} catalog nodes unavailable", icon='ERROR')
+            row.operator("quicknodes.report_unresolved", text="Report")
+
+def get_preferences():
+    """Return the add-on preferences, or None when they are not available"""
+    addon = bpy.context.preferences.addons.get(__name__)
+    return addon.preferences if addon else None
+
+# Property groups, registered before everything else
+property_classes = (
+    QuickNodesPreferences,
+    QuickNodesStagedModifier,
+    QuickNodesStagedTree,
+    QuickNodesBasketItem,
+    QuickNodesSearchState,
+    QuickNodesProperties,
+)
 
 # Register all classes
 classes = (
-    QuickNodesProperties,
     QUICKNODES_OT_add_node,
     QUICKNODES_OT_add_simulation_zone,
     QUICKNODES_OT_add_foreach_element_zone,
     QUICKNODES_OT_add_repeat_zone,
     QUICKNODES_OT_add_closure_zone,
+    QUICKNODES_OT_add_batch,
+    QUICKNODES_OT_basket_remove,
+    QUICKNODES_OT_basket_clear,
+    QUICKNODES_OT_search_page,
+    QUICKNODES_OT_add_library_group,
+    QUICKNODES_OT_rescan_libraries,
+    QUICKNODES_OT_favorite_add,
+    QUICKNODES_OT_favorite_remove,
+    QUICKNODES_OT_report_unresolved,
     NODE_PT_quick_nodes_main,
     NODE_PT_quick_nodes_search,
     NODE_PT_quick_nodes_favorites,
-) + tuple(category_panels)
+    NODE_PT_quick_nodes_groups,
+    NODE_PT_quick_nodes_library,
+    NODE_PT_quick_nodes_recent,
+    NODE_PT_quick_nodes_debug,
+    QUICKNODES_OT_export_timings,
+    QUICKNODES_OT_reset_timings,
+)
+
+# Application handlers, (bpy.app.handlers list name, function)
+app_handlers = (
+    ("save_pre", staging_save_pre),
+    ("save_post", staging_save_post),
+    ("load_post", staging_load_post),
+    ("load_post", placement_load_post),
+    ("load_post", node_groups_load_post),
+    ("depsgraph_update_post", node_groups_depsgraph_update_post),
+    ("undo_post", invalidate_node_groups),
+    ("redo_post", invalidate_node_groups),
+    ("load_post", search_state_load_post),
+    ("load_post", library_load_post),
+)
 
 def register():
-    # Register the property first
-    bpy.utils.register_class(QuickNodesProperties)
+    # Register the properties first
+    for cls in property_classes:
+        bpy.utils.register_class(cls)
     bpy.types.Scene.quick_nodes_props = bpy.props.PointerProperty(type=QuickNodesProperties)
+    bpy.types.Screen.quick_nodes_searches = bpy.props.CollectionProperty(type=QuickNodesSearchState)
     
     # Then register the other classes
-    for cls in classes[1:]:  # Skip QuickNodesProperties as it's already registered
+    for cls in classes:
         bpy.utils.register_class(cls)
+    
+    prefs = get_preferences()
+    set_profiling(prefs.enable_profiling if prefs else False)
+    
+    # Catalog, usage, favorites and library caches are built after startup,
+    # or on demand if they are needed first
+    schedule_warmup()
+    
+    # Category panels, subcategories wait for their category to be expanded in lazy mode
+    lazy = prefs.lazy_panels if prefs else True
+    for cls in create_category_panels(subcategories=not lazy):
+        register_panel(cls)
+    if lazy:
+        _pending_subcategories.update(
+            name for name, subcategory_names in get_panel_layout().items() if subcategory_names)
+    
+    for handler_name, handler in app_handlers:
+        getattr(bpy.app.handlers, handler_name).append(handler)
+    subscribe_node_group_renames()
 
 def unregister():
+    # End staging so no modifier stays hidden
+    for props in scene_quick_nodes_props():
+        end_staging(props)
+        props.staging_mode = False
+    
+    # Write pending usage statistics now, the flush timer won't run any more
+    if bpy.app.timers.is_registered(flush_usage_stats):
+        bpy.app.timers.unregister(flush_usage_stats)
+    cancel_warmup()
+    flush_usage_stats()
+    stop_library_scan()
+    for handler_name, handler in app_handlers:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if handler in handlers:
+            handlers.remove(handler)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    invalidate_node_groups()
+    
     # Unregister in reverse order
-    for cls in reversed(classes[1:]):  # Skip QuickNodesProperties for now
+    _pending_subcategories.clear()
+    while _registered_panels:
+        bpy.utils.unregister_class(_registered_panels.pop())
+    for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     
-    # Remove the property
+    # Remove the properties
     if hasattr(bpy.types.Scene, 'quick_nodes_props'):
         del bpy.types.Scene.quick_nodes_props
+    if hasattr(bpy.types.Screen, 'quick_nodes_searches'):
+        del bpy.types.Screen.quick_nodes_searches
+    _pending_search_states.clear()
     
-    # Finally unregister the property class
-    bpy.utils.unregister_class(QuickNodesProperties)
+    # Finally unregister the property classes
+    for cls in reversed(property_classes):
+        bpy.utils.unregister_class(cls)
 
 if __name__ == "__main__":
     register()
@@ -0,0 +1,211 @@
+# License-Identifier: GPL-3.0-or-later
+
+# Quick Nodes
+# Copyright (C) 2025 Lloyd DeAlmeida
+
+"""Headless benchmarks for QuickNodesV1.py.
+
+Runs under plain CPython with the stand-in bpy from fake_bpy.py and writes
+machine-readable results so runs can be compared:
+
+    python benchmarks/bench_quicknodes.py --output after.json
+    python benchmarks/bench_quicknodes.py --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fake_bpy
+
+bpy = fake_bpy.install()
+
+import QuickNodesV1 as quick_nodes
+
+
+DEFAULT_SIZES = (100, 1000, 10000, 50000)
+SEARCH_QUERIES = ("e", "curve", "set pos", "instnce", "trnsform")
+
+
+def measure(function, repeat, setup=None):
+    """Return timing stats in milliseconds over repeat calls of function"""
+    samples = []
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        if setup is not None:
+            function(argument)
+        else:
+            function()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "repeat": repeat,
+    }
+
+
+def catalog_node_types():
+    """Return {bl_idname: label} for every node type the add-on's catalogs reference"""
+    node_types = {}
+    for categories in quick_nodes.TREE_CATALOG_OVERRIDES.values():
+        for node_type, label in quick_nodes.flatten_catalog(categories):
+            if not node_type.startswith("QUICKNODES_OT_"):
+                node_types[node_type] = label
+    for zone in quick_nodes.ZONE_OPERATORS.values():
+        node_types[zone.zone_input] = zone.zone_input
+        node_types[zone.zone_output] = zone.zone_output
+    return node_types
+
+
+def bench_registration(results, repeat):
+    def cycle():
+        quick_nodes.register()
+        quick_nodes.unregister()
+    results["register_unregister"] = measure(cycle, repeat)
+    results["create_category_panels"] = measure(quick_nodes.create_category_panels, repeat)
+    results["create_category_panels_lazy"] = measure(
+        lambda: quick_nodes.create_category_panels(subcategories=False), repeat)
+
+
+def bench_search(results, repeat, sizes):
+    view = quick_nodes.get_catalog_view("GeometryNodeTree")
+    for query in SEARCH_QUERIES:
+        results[f"search[{query}]"] = measure(
+            lambda: view.search_index.search(query, quick_nodes.SEARCH_PAGE_SIZE), repeat)
+
+    def cached():
+        quick_nodes.get_search_results("curve", "GeometryNodeTree")
+    cached()
+    results["search_cached[curve]"] = measure(cached, repeat)
+
+    # A broad query ranked once, then paged through
+    def pages():
+        quick_nodes.invalidate_search_cache()
+        total, _ = quick_nodes.get_search_results("e", "GeometryNodeTree")
+        for page in range(1, -(-total // quick_nodes.SEARCH_PAGE_SIZE)):
+            quick_nodes.get_search_results("e", "GeometryNodeTree", page)
+    results["search_all_pages[e]"] = measure(pages, repeat)
+
+    # Synthetic catalogs the size of large node group and asset libraries
+    for size in sizes:
+        nodes = [(node_type, f"{label} {i}") for i in range(size // len(view.nodes) + 1)
+                 for node_type, label in view.nodes][:size]
+        results[f"search_index_build[{size}]"] = measure(
+            lambda: quick_nodes.NodeSearchIndex(nodes), max(1, repeat // 10))
+        index = quick_nodes.NodeSearchIndex(nodes)
+        for query in ("curve", "instnce"):
+            results[f"search[{query}]@{size}"] = measure(
+                lambda: index.search(query, quick_nodes.SEARCH_PAGE_SIZE), repeat)
+
+
+def bench_panel_polls(results, repeat):
+    panels = quick_nodes.create_category_panels()
+    for tree_type in ("GeometryNodeTree", "ShaderNodeTree"):
+        context = fake_bpy.make_context(
+            fake_bpy.FakeNodeTree(bl_idname=tree_type), quick_nodes.QuickNodesProperties)
+
+        def poll_all():
+            for cls in panels:
+                cls.poll(context)
+        results[f"poll_category_panels[{tree_type}]"] = measure(poll_all, repeat)
+
+
+def bench_tree_operations(results, repeat, sizes):
+    operators = [
+        ("add_node", quick_nodes.QUICKNODES_OT_add_node, {"node_type": "GeometryNodeSetPosition",
+                                                          "node_label": "Set Position"}),
+        ("add_batch", quick_nodes.QUICKNODES_OT_add_batch, {
+            "node_types": ",".join(["GeometryNodeSetPosition", "ShaderNodeMath"] * 5)}),
+    ]
+    operators += [(cls.bl_idname.split(".")[-1], cls, {}) for cls in quick_nodes.ZONE_OPERATORS.values()]
+
+    for size in sizes:
+        def selected_tree():
+            return fake_bpy.make_context(fake_bpy.make_tree(size), quick_nodes.QuickNodesProperties)
+        results[f"deselect_all_nodes@{size}"] = measure(
+            quick_nodes.deselect_all_nodes, repeat, setup=selected_tree)
+
+        # The per-node loop deselect_all_nodes replaced, for comparison
+        def deselect_loop(context):
+            for node in context.space_data.edit_tree.nodes:
+                node.select = False
+        results[f"deselect_loop@{size}"] = measure(deselect_loop, repeat, setup=selected_tree)
+
+        for name, cls, values in operators:
+            operator = fake_bpy.instantiate(cls, **values)
+            results[f"{name}@{size}"] = measure(operator.execute, repeat, setup=selected_tree)
+
+
+def run(sizes, repeat):
+    results = {}
+    fake_bpy.define_node_types(catalog_node_types())
+    bench_registration(results, repeat)
+
+    quick_nodes.register()
+    bpy.app.timers.run()
+    try:
+        bench_search(results, repeat, sizes)
+        bench_panel_polls(results, repeat)
+        bench_tree_operations(results, repeat, sizes)
+    finally:
+        quick_nodes.unregister()
+    return {
+        "meta": {
+            "addon_version": ".".join(str(part) for part in quick_nodes.bl_info["version"]),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sizes": list(sizes),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline):
+    """Print the median of every benchmark next to the baseline's"""
+    print(f"{'benchmark':44} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}")
+    for name, stats in sorted(current["results"].items()):
+        before = baseline["results"].get(name)
+        now = stats["median_ms"]
+        if before is None:
+            print(f"{name:44} {'-':>12} {now:12.4f} {'-':>7}")
+        else:
+            ratio = now / before["median_ms"] if before["median_ms"] else float("inf")
+            print(f"{name:44} {before['median_ms']:12.4f} {now:12.4f} {ratio:7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma separated node tree sizes")
+    parser.add_argument("--repeat", type=int, default=20, help="calls per benchmark")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    args = parser.parse_args()
+
+    sizes = tuple(int(size) for size in args.sizes.split(",") if size)
+    current = run(sizes, args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=1)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(current, json.load(f))
+    elif not args.output:
+        json.dump(current, sys.stdout, indent=1)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+# License-Identifier: GPL-3.0-or-later
+
+# Quick Nodes
+# Copyright (C) 2025 Lloyd DeAlmeida
+
+"""Lightweight stand-in for the parts of bpy used by QuickNodes.
+
+Only meant for the headless benchmarks: it lets QuickNodesV1.py be imported,
+registered and driven under plain CPython. RNA calls such as nodes.new or
+foreach_set are plain Python here, so absolute timings of code dominated by
+Blender itself are not representative; the Python-side overhead of the
+add-on and how it scales with tree and catalog size are.
+"""
+
+import os
+import sys
+import tempfile
+import types
+
+
+# Fake node trees
+# ============================================================================
+
+class FakeSocket:
+    def __init__(self, name, socket_type, node):
+        self.name = name
+        self.identifier = name
+        self.type = socket_type
+        self.node = node
+        self.enabled = True
+        self.hide = False
+        self.is_linked = False
+        self.is_multi_input = False
+        self.links = []
+
+
+class FakeNode:
+    def __init__(self, bl_idname, name):
+        self.bl_idname = bl_idname
+        self.name = name
+        self.label = ""
+        self.location = (0.0, 0.0)
+        self.width = 140.0
+        self.dimensions = (0.0, 0.0)
+        self.select = False
+        self.node_tree = None
+        self.inputs = [FakeSocket("Geometry", 'GEOMETRY', self)]
+        self.outputs = [FakeSocket("Geometry", 'GEOMETRY', self)]
+        self.paired_output = None
+
+    def pair_with_output(self, other):
+        self.paired_output = other
+        return True
+
+
+class FakeNodes(list):
+    def __init__(self):
+        super().__init__()
+        self.active = None
+
+    def new(self, type):
+        if not hasattr(sys.modules["bpy"].types, type):
+            raise RuntimeError(f"Node type {type} undefined")
+        node = FakeNode(type, f"{type}.{len(self):03d}")
+        self.append(node)
+        return node
+
+    def get(self, name):
+        return next((node for node in self if node.name == name), None)
+
+    def foreach_set(self, attr, seq):
+        for node, value in zip(self, seq):
+            setattr(node, attr, value)
+
+    def foreach_get(self, attr, seq):
+        flat = []
+        for node in self:
+            value = getattr(node, attr)
+            if isinstance(value, (tuple, list)):
+                flat.extend(value)
+            else:
+                flat.append(value)
+        seq[:] = type(seq)(seq.typecode, flat) if hasattr(seq, "typecode") else flat
+
+
+class FakeLink:
+    def __init__(self, from_socket, to_socket):
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+        self.from_node = from_socket.node
+        self.to_node = to_socket.node
+        self.is_valid = True
+
+
+class FakeLinks(list):
+    def new(self, from_socket, to_socket):
+        link = FakeLink(from_socket, to_socket)
+        self.append(link)
+        from_socket.is_linked = to_socket.is_linked = True
+        from_socket.links.append(link)
+        to_socket.links.append(link)
+        return link
+
+    def remove(self, link):
+        super().remove(link)
+        link.from_socket.links.remove(link)
+        link.to_socket.links.remove(link)
+        link.from_socket.is_linked = bool(link.from_socket.links)
+        link.to_socket.is_linked = bool(link.to_socket.links)
+
+
+class FakeNodeTree:
+    def __init__(self, name="Geometry Nodes", bl_idname="GeometryNodeTree"):
+        self.name = name
+        self.bl_idname = bl_idname
+        self.nodes = FakeNodes()
+        self.links = FakeLinks()
+
+    def as_pointer(self):
+        return id(self)
+
+
+def make_tree(node_count, bl_idname="GeometryNodeTree", selected=True):
+    """Return a tree with node_count nodes laid out on a grid"""
+    tree = FakeNodeTree(bl_idname=bl_idname)
+    for i in range(node_count):
+        node = tree.nodes.new("GeometryNodeSetPosition")
+        node.location = ((i % 200) * 200.0, -(i // 200) * 200.0)
+        node.select = selected
+    return tree
+
+
+# Fake UI
+# ============================================================================
+
+class FakeLayout:
+    """Layout that accepts any call and counts the items created"""
+    items = 0
+
+    def __getattr__(self, name):
+        def item(*args, **kwargs):
+            FakeLayout.items += 1
+            return FakeLayout()
+        return item
+
+    def __setattr__(self, name, value):
+        pass
+
+
+class FakeCollection(list):
+    def __init__(self, item_type=None):
+        super().__init__()
+        self.item_type = item_type
+
+    def add(self):
+        item = instantiate(self.item_type) if self.item_type else types.SimpleNamespace()
+        self.append(item)
+        return item
+
+    def remove(self, index):
+        del self[index]
+
+    def clear(self):
+        del self[:]
+
+    def get(self, name, default=None):
+        return next((item for item in self if getattr(item, "name", None) == name), default)
+
+
+def instantiate(cls, **values):
+    """Create cls with the defaults of its property annotations, like Blender does"""
+    obj = cls.__new__(cls)
+    annotations = {}
+    for base in reversed(cls.__mro__):
+        annotations.update(base.__dict__.get("__annotations__", {}))
+    for name, (kind, kwargs) in annotations.items():
+        if kind == "CollectionProperty":
+            value = FakeCollection(kwargs.get("type"))
+        elif kind == "PointerProperty":
+            value = instantiate(kwargs["type"])
+        else:
+            value = kwargs.get("default", _PROPERTY_DEFAULTS.get(kind))
+        object.__setattr__(obj, name, value)
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+    return obj
+
+
+_PROPERTY_DEFAULTS = {
+    "StringProperty": "",
+    "BoolProperty": False,
+    "IntProperty": 0,
+    "FloatProperty": 0.0,
+    "EnumProperty": "",
+}
+
+
+def make_context(tree, scene_props_cls=None):
+    """Return a context whose Node Editor edits tree"""
+    space = types.SimpleNamespace(
+        type='NODE_EDITOR', edit_tree=tree, node_tree=tree, tree_type=tree.bl_idname,
+        cursor_location=(0.0, 0.0))
+    area = types.SimpleNamespace(type='NODE_EDITOR', spaces=[space], tag_redraw=lambda: None)
+    area.as_pointer = lambda: id(area)
+    scene = types.SimpleNamespace(name="Scene")
+    if scene_props_cls is not None:
+        scene.quick_nodes_props = instantiate(scene_props_cls)
+    bpy = sys.modules["bpy"]
+    screen = types.SimpleNamespace(name=f"Layout.{len(bpy.data.screens):03d}", areas=[area])
+    # Collections registered on bpy.types.Screen, such as per-editor state
+    for name, value in vars(bpy.types.Screen).items():
+        if isinstance(value, tuple) and value[0] == "CollectionProperty":
+            setattr(screen, name, FakeCollection(value[1].get("type")))
+    bpy.data.screens.append(screen)
+    return types.SimpleNamespace(
+        space_data=space, area=area, scene=scene, window=None,
+        window_manager=bpy.context.window_manager, preferences=bpy.context.preferences,
+        screen=screen)
+
+
+# Fake bpy module
+# ============================================================================
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+def _property(kind):
+    def factory(**kwargs):
+        return (kind, kwargs)
+    return factory
+
+
+# Callbacks Blender validates on register_class -> argument count, self or cls included
+_CALLBACK_ARGS = {
+    "poll": 2,
+    "draw": 2,
+    "draw_header": 2,
+    "execute": 2,
+    "check": 2,
+    "cancel": 2,
+    "invoke": 3,
+    "modal": 3,
+}
+
+
+class _Registry:
+    def __init__(self):
+        self.classes = []
+
+    def register_class(self, cls):
+        if cls in self.classes:
+            raise ValueError(f"{cls.__name__} already registered")
+        self.validate(cls)
+        self.classes.append(cls)
+
+    @staticmethod
+    def validate(cls):
+        """Reject callbacks Blender would reject, like bpy_class_validate"""
+        for name, arg_count in _CALLBACK_ARGS.items():
+            function = getattr(cls, name, None)
+            if function is None:
+                continue
+            if name == "poll":
+                if not isinstance(getattr(function, "__self__", None), type):
+                    raise ValueError(f"expected {cls.__name__} class \"poll\" attribute to be a class method")
+                function = function.__func__
+            found = function.__code__.co_argcount
+            if found != arg_count:
+                raise ValueError(
+                    f"expected {cls.__name__} class \"{name}\" function to have {arg_count} args, found {found}")
+
+    def unregister_class(self, cls):
+        self.classes.remove(cls)
+
+
+class _Timers:
+    def __init__(self):
+        self.pending = []
+
+    def register(self, function, first_interval=0.0, persistent=False):
+        self.pending.append(function)
+
+    def unregister(self, function):
+        if function in self.pending:
+            self.pending.remove(function)
+
+    def is_registered(self, function):
+        return function in self.pending
+
+    def run(self, limit=100000):
+        """Run the pending timers until none is left, rescheduling those returning a delay"""
+        runs = 0
+        while self.pending and runs < limit:
+            function = self.pending.pop(0)
+            if function() is not None:
+                self.pending.append(function)
+            runs += 1
+        return runs
+
+
+def install(config_dir=None):
+    """Install the fake bpy into sys.modules and return it"""
+    if "bpy" in sys.modules and getattr(sys.modules["bpy"], "IS_FAKE", False):
+        return sys.modules["bpy"]
+
+    config_dir = config_dir or tempfile.mkdtemp(prefix="quick_nodes_bench_")
+    registry = _Registry()
+    timers = _Timers()
+
+    class Node:
+        pass
+
+    bpy_types = _module(
+        "bpy.types",
+        Panel=type("Panel", (), {}),
+        Operator=type("Operator", (), {"report": lambda self, level, message: None}),
+        PropertyGroup=type("PropertyGroup", (), {}),
+        AddonPreferences=type("AddonPreferences", (), {}),
+        UIList=type("UIList", (), {}),
+        Menu=type("Menu", (), {}),
+        Node=Node,
+        ID=type("ID", (), {}),
+        NodeTree=type("NodeTree", (), {}),
+        Scene=type("Scene", (), {}),
+        Screen=type("Screen", (), {}),
+        WindowManager=type("WindowManager", (), {}),
+        SpaceNodeEditor=type("SpaceNodeEditor", (), {}),
+    )
+    bpy_props = _module("bpy.props", **{
+        name: _property(name) for name in (
+            "StringProperty", "BoolProperty", "IntProperty", "FloatProperty",
+            "EnumProperty", "PointerProperty", "CollectionProperty")
+    })
+
+    def user_resource(resource_type, path="", create=False):
+        folder = os.path.join(config_dir, resource_type.lower(), path)
+        if create:
+            os.makedirs(folder, exist_ok=True)
+        return folder
+
+    bpy_utils = _module(
+        "bpy.utils",
+        register_class=registry.register_class,
+        unregister_class=registry.unregister_class,
+        user_resource=user_resource,
+        registry=registry,
+    )
+    handlers = _module("bpy.app.handlers", persistent=lambda function: function)
+    for name in ("load_pre", "load_post", "save_pre", "save_post", "undo_pre", "undo_post",
+                 "redo_pre", "redo_post", "depsgraph_update_post"):
+        setattr(handlers, name, [])
+    app = _module(
+        "bpy.app", version=(5, 0, 0), build_hash=b"benchmark", background=True,
+        timers=timers, handlers=handlers)
+    sys.modules["bpy.app.timers"] = timers
+    msgbus = _module(
+        "bpy.msgbus",
+        subscribe_rna=lambda **kwargs: None,
+        clear_by_owner=lambda owner: None)
+    bpy_path = _module("bpy.path", abspath=lambda path: path)
+    ops = _module("bpy.ops", ed=types.SimpleNamespace(undo_push=lambda message="": None))
+
+    preferences = types.SimpleNamespace(addons={}, filepaths=types.SimpleNamespace(asset_libraries=[]))
+    window_manager = types.SimpleNamespace(windows=[])
+    context = types.SimpleNamespace(
+        preferences=preferences, window_manager=window_manager, space_data=None, window=None)
+    data = types.SimpleNamespace(
+        objects=FakeCollection(), scenes=FakeCollection(), node_groups=FakeCollection(),
+        screens=FakeCollection(), filepath="")
+
+    return _module(
+        "bpy", IS_FAKE=True, types=bpy_types, props=bpy_props, utils=bpy_utils, app=app,
+        msgbus=msgbus, path=bpy_path, ops=ops, context=context, data=data)
+
+
+def define_node_types(node_types):
+    """Make node_types ({bl_idname: label}) known to the fake bpy.types"""
+    bpy = sys.modules["bpy"]
+    for bl_idname, label in node_types.items():
+        bl_rna = types.SimpleNamespace(identifier=bl_idname, name=label)
+        setattr(bpy.types, bl_idname, type(bl_idname, (bpy.types.Node,), {"bl_rna": bl_rna}))